@@ -1,480 +1,141 @@
 import streamlit as st
+import hmac
 import os
+import time
 from pathlib import Path
-from PIL import Image
-import base64
-import toml
-
-# Завантаження конфігурації (БЕЗ Streamlit декораторів, щоб працювало перед set_page_config)
-def load_config():
-    """Завантаження конфігурації з config.toml"""
-    config_path = "config.toml"
-    if os.path.exists(config_path):
-        with open(config_path, "r", encoding="utf-8") as f:
-            return toml.load(f)
-    else:
-        return {}
-
-config = load_config()
+from streamlit.web.server.websocket_headers import _get_websocket_headers
+from heating import metrics
+from heating import fast_path  # noqa: F401 (маршрут готових сторінок)
+from heating import warmup
+from heating.doc_cache import get_document_cache
+from heating.file_server import file_url
+from heating.fragments import fragment
+from heating.gallery import get_manifest, picture_html
+from heating.ingest import ingest, recent_jobs
+from heating.optimize_pdfs import preferred_path
+from heating.pdf_windows import page_count, window_bounds, window_count, window_path
+from heating.router import Router
+from heating.search import get_index
+from heating.server import install_routes
+from heating.static_site import order_photos
+from heating.tariffs import extract_tariffs
+from heating.tenants import get_registry
+from heating.theme import stylesheet_html
+
+rerun_started = time.perf_counter()
+
+# Визначення підприємства для сесії (БЕЗ Streamlit елементів, щоб працювало перед set_page_config):
+# параметр ?tenant=, ім'я хоста або підприємство за замовчуванням з config.toml
+def request_host():
+    """Ім'я хоста з заголовків запиту (поза браузерною сесією його немає)"""
+    try:
+        return (_get_websocket_headers() or {}).get("Host")
+    except RuntimeError:
+        return None
+
+if "tenant" not in st.session_state:
+    st.session_state.tenant = get_registry().resolve(
+        st.query_params.get("tenant"),
+        request_host()
+    ).slug
+
+tenant = get_registry().get(st.session_state.tenant) or get_registry().resolve()
+metrics.set_labels(tenant=tenant.slug, page="")
+with metrics.span("config"):
+    config = tenant.config
+metrics.configure(config.settings.metrics, config.settings.metrics_trace)
 
 # Налаштування сторінки
 st.set_page_config(
-    page_title=config.get("company", {}).get("name", "Назва підприємства"),
-    page_icon=config.get("company", {}).get("icon", "🔥"),
+    page_title=config.company.name,
+    page_icon=config.company.icon or None,
     layout="wide",
     initial_sidebar_state="auto"  # На мобільних закритий, на десктопі відкритий
 )
 
-# Отримання кольорів з конфігу
-primary_color = config.get("theme", {}).get("primary_color", "#FF6B35")
-secondary_color = config.get("theme", {}).get("secondary_color", "#E55A2B")
-text_color = config.get("theme", {}).get("text_color", "#2E4053")
-bg_light = config.get("theme", {}).get("background_light", "#F0F2F6")
-text_muted = config.get("theme", {}).get("text_muted", "#5D6D7E")
-
-# Custom CSS для покращення дизайну
-st.markdown(f"""
-    <style>
-    .main-header {{
-        font-size: 4rem;
-        font-weight: bold;
-        color: {primary_color};
-        text-align: center;
-        padding: 1.5rem 0;
-        margin-bottom: 1.5rem;
-    }}
-
-    .section-header {{
-        font-size: 2rem;
-        font-weight: bold;
-        color: {text_color};
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-        padding: 0.5rem;
-        background: linear-gradient(90deg, {primary_color} 0%, transparent 100%);
-        border-radius: 5px;
-    }}
-
-    .info-box {{
-        background-color: {bg_light};
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 5px solid {primary_color};
-        margin-bottom: 1rem;
-    }}
-
-    .contact-item {{
-        font-size: 1.1rem;
-        padding: 0.5rem 0;
-        display: flex;
-        align-items: center;
-    }}
-
-    .contact-icon {{
-        color: {primary_color};
-        margin-right: 10px;
-        font-size: 1.3rem;
-    }}
-
-    .document-card {{
-        background-color: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin-bottom: 1rem;
-        border: 1px solid #E0E0E0;
-        transition: transform 0.2s;
-    }}
-
-    .document-card:hover {{
-        transform: translateY(-5px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-    }}
-
-    /* Навігаційні картки */
-    .nav-card {{
-        background: linear-gradient(135deg, {bg_light} 0%, white 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border: 2px solid {bg_light};
-        transition: all 0.3s ease;
-        height: 100%;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-    }}
-
-    .nav-card:hover {{
-        border-color: {primary_color};
-        box-shadow: 0 4px 16px rgba(255, 107, 53, 0.2);
-        transform: translateY(-5px);
-    }}
-
-    .nav-card h3 {{
-        color: {primary_color};
-        margin-bottom: 0.5rem;
-    }}
-
-    .nav-card p {{
-        color: {text_muted};
-        font-size: 0.95rem;
-        margin-bottom: 1rem;
-    }}
-
-    .photo-caption {{
-        text-align: center;
-        color: {text_muted};
-        font-style: italic;
-        margin-top: 0.5rem;
-    }}
-
-    .stButton>button {{
-        background-color: {primary_color};
-        color: white;
-        border-radius: 5px;
-        padding: 0.5rem 2rem;
-        font-weight: bold;
-        border: none;
-        transition: background-color 0.3s;
-    }}
-
-    .stButton>button:hover {{
-        background-color: {secondary_color};
-    }}
-
-    div[data-testid="stFileUploader"] {{
-        background-color: {bg_light};
-        padding: 1rem;
-        border-radius: 10px;
-        border: 2px dashed {primary_color};
-    }}
-
-    /* Навігаційне меню */
-    .nav-container {{
-        display: flex;
-        justify-content: center;
-        gap: 0;
-        margin-bottom: 3rem;
-        border-bottom: 3px solid #E0E0E0;
-    }}
-
-    .nav-item {{
-        flex: 1;
-        max-width: 250px;
-        text-align: center;
-        padding: 1.2rem 2rem;
-        cursor: pointer;
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: {text_muted};
-        background-color: #FFFFFF;
-        border: none;
-        border-bottom: 3px solid transparent;
-        transition: all 0.3s ease;
-        text-decoration: none;
-        position: relative;
-    }}
-
-    .nav-item:hover {{
-        color: {primary_color};
-        background-color: #FFF5F2;
-        border-bottom: 3px solid {primary_color};
-    }}
-
-    .nav-item.active {{
-        color: {primary_color};
-        background-color: #FFF5F2;
-        border-bottom: 3px solid {primary_color};
-    }}
-
-    .nav-icon {{
-        font-size: 1.5rem;
-        display: block;
-        margin-bottom: 0.3rem;
-    }}
-
-    /* Sidebar стилізація */
-    [data-testid="stSidebar"] {{
-        background: linear-gradient(180deg, {primary_color} 0%, {secondary_color} 100%);
-    }}
-
-    [data-testid="stSidebar"] * {{
-        color: white !important;
-    }}
-
-    [data-testid="stSidebar"] h2 {{
-        color: white !important;
-        font-size: 1.5rem !important;
-        margin-bottom: 0 !important;
-    }}
-
-    [data-testid="stSidebar"] h3 {{
-        color: white !important;
-        font-size: 1.2rem !important;
-    }}
-
-    [data-testid="stSidebar"] .stRadio > label {{
-        color: white !important;
-        font-weight: 600;
-        font-size: 1.1rem;
-    }}
-
-    /* Приховуємо radio кнопки (кружечки) */
-    [data-testid="stSidebar"] [role="radiogroup"] input[type="radio"] {{
-        opacity: 0;
-        width: 0;
-        height: 0;
-        position: absolute;
-    }}
-
-    [data-testid="stSidebar"] [role="radiogroup"] label {{
-        background-color: rgba(255, 255, 255, 0.15);
-        padding: 1rem 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 0.5rem;
-        transition: all 0.3s;
-        cursor: pointer;
-        font-size: 1.1rem;
-        display: flex;
-        align-items: center;
-        width: 100%;
-    }}
-
-    [data-testid="stSidebar"] [role="radiogroup"] label p {{
-        color: white !important;
-        margin: 0;
-        font-size: 1.1rem;
-    }}
-
-    [data-testid="stSidebar"] [role="radiogroup"] label:hover {{
-        background-color: rgba(255, 255, 255, 0.25);
-        transform: translateX(5px);
-        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-    }}
-
-    [data-testid="stSidebar"] [role="radiogroup"] label[data-checked="true"] {{
-        background-color: white;
-        color: {primary_color} !important;
-        border-left: 5px solid #FFC107;
-        font-weight: bold;
-    }}
-
-    [data-testid="stSidebar"] [role="radiogroup"] label[data-checked="true"] p {{
-        color: {primary_color} !important;
-    }}
-
-    /* Приховуємо кружечок radio */
-    [data-testid="stSidebar"] [role="radiogroup"] label > div:first-child {{
-        display: none !important;
-    }}
-
-    [data-testid="stSidebar"] hr {{
-        border-color: rgba(255, 255, 255, 0.3) !important;
-        margin: 1rem 0 !important;
-    }}
-
-    [data-testid="stSidebar"] .element-container {{
-        color: white !important;
-    }}
-
-    [data-testid="stSidebar"] .stAlert {{
-        background-color: rgba(255, 255, 255, 0.2) !important;
-        border: 1px solid rgba(255, 255, 255, 0.3) !important;
-        color: white !important;
-    }}
-
-    section[data-testid="stSidebar"] > div {{
-        padding-top: 2rem;
-    }}
-
-    /* === МОБІЛЬНА АДАПТАЦІЯ === */
-    @media only screen and (max-width: 768px) {{
-        .main-header {{
-            font-size: 2.5rem !important;
-            padding: 1rem 0 !important;
-        }}
-
-        .section-header {{
-            font-size: 1.5rem !important;
-            padding: 0.3rem !important;
-        }}
-
-        .info-box {{
-            padding: 1rem !important;
-        }}
-
-        .contact-item {{
-            font-size: 1rem !important;
-            padding: 0.3rem 0 !important;
-        }}
-
-        .nav-item {{
-            padding: 0.8rem 1rem !important;
-            font-size: 0.9rem !important;
-        }}
-
-        /* Sidebar на мобільних */
-        [data-testid="stSidebar"] {{
-            width: 280px !important;
-        }}
-
-        [data-testid="stSidebar"] [role="radiogroup"] label {{
-            padding: 0.8rem 1rem !important;
-            font-size: 1rem !important;
-        }}
-
-        /* Навігаційні картки на планшетах */
-        .nav-card {{
-            padding: 1rem !important;
-        }}
-
-        .nav-card h3 {{
-            font-size: 1.2rem !important;
-        }}
-
-        .nav-card p {{
-            font-size: 0.85rem !important;
-        }}
-    }}
-
-    /* Дуже маленькі екрани */
-    @media only screen and (max-width: 480px) {{
-        .main-header {{
-            font-size: 2rem !important;
-        }}
-
-        .section-header {{
-            font-size: 1.3rem !important;
-        }}
-
-        /* Навігаційні картки на телефонах */
-        .nav-card {{
-            padding: 0.8rem !important;
-            margin-bottom: 1rem !important;
-        }}
-
-        .nav-card h3 {{
-            font-size: 1.1rem !important;
-        }}
-
-        .nav-card p {{
-            font-size: 0.8rem !important;
-        }}
-
-        [data-testid="stSidebar"] {{
-            width: 100% !important;
-        }}
-    }}
-    </style>
-""", unsafe_allow_html=True)
+# Підключаємо маршрути віддачі файлів до сервера Streamlit
+routes_ready = install_routes()
+# Без heating.serve прогрів починається з першою сесією
+if routes_ready:
+    warmup.start()
+
+# Стилі сайту: скомпільований файл теми, який браузер кешує
+with metrics.span("theme"):
+    st.markdown(stylesheet_html(config.theme, tenant.cache_dir("theme"), tenant.slug, served=routes_ready), unsafe_allow_html=True)
 
 # Функція для відображення PDF
-def display_pdf(file_path=None, pdf_data=None):
-    """Відображення PDF файлу"""
+def display_pdf(file_path):
+    """Відображення PDF файлу за посиланням на сервер (браузер кешує та довантажує частинами)"""
     try:
-        if pdf_data:
-            base64_pdf = base64.b64encode(pdf_data).decode('utf-8')
-            pdf_display = f'''
-            <embed src="data:application/pdf;base64,{base64_pdf}"
-                   width="100%"
-                   height="800px"
-                   type="application/pdf"
-                   style="border: 1px solid #E0E0E0; border-radius: 5px;">
-            '''
-            st.markdown(pdf_display, unsafe_allow_html=True)
-        elif file_path and os.path.exists(file_path):
-            with open(file_path, "rb") as f:
-                base64_pdf = base64.b64encode(f.read()).decode('utf-8')
+        if file_path and os.path.exists(file_path):
+            viewer_height = config.settings.pdf_viewer_height
             pdf_display = f'''
-            <embed src="data:application/pdf;base64,{base64_pdf}"
+            <embed src="{file_url(file_path, tenant.slug)}"
                    width="100%"
-                   height="800px"
+                   height="{viewer_height}"
                    type="application/pdf"
                    style="border: 1px solid #E0E0E0; border-radius: 5px;">
             '''
-            st.markdown(pdf_display, unsafe_allow_html=True)
+            with metrics.span("pdf_embed"):
+                st.markdown(pdf_display, unsafe_allow_html=True)
         else:
             st.warning("📄 Документ ще не завантажено")
     except Exception as e:
         st.error(f"Помилка при відображенні PDF: {str(e)}")
         st.info("💡 Будь ласка, скористайтесь кнопкою завантаження для перегляду документа")
 
-# Функція для збереження файлу
-def save_uploaded_file(uploaded_file, folder):
-    """Збереження завантаженого файлу"""
-    if uploaded_file is not None:
-        file_path = os.path.join(folder, uploaded_file.name)
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        return file_path
-    return None
+# Функція для перегляду великого PDF частинами
+def display_pdf_windowed(file_path, state_key):
+    """Відображення PDF вікнами по кілька сторінок; наступне вікно створюється лише на запит"""
+    window_pages = config.settings.pdf_window_pages
+    windows_cache = tenant.cache_dir("pdf_windows")
+    try:
+        total_windows = window_count(file_path, window_pages)
+        window = min(st.session_state.get(state_key, 0), total_windows - 1)
+        start, end = window_bounds(file_path, window, window_pages)
+
+        st.caption(f"Сторінки {start + 1}–{end} з {page_count(file_path)}")
+        with metrics.span("pdf_window"):
+            window_file = window_path(file_path, start, end, windows_cache)
+        display_pdf(window_file)
+
+        if total_windows > 1:
+            def set_window(new_window):
+                st.session_state[state_key] = new_window
+
+            prev_col, _, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                st.button("⬅️ Попередні сторінки", key=f"{state_key}_prev", disabled=window == 0,
+                          on_click=set_window, args=(window - 1,), use_container_width=True)
+            with next_col:
+                st.button("Наступні сторінки ➡️", key=f"{state_key}_next", disabled=window >= total_windows - 1,
+                          on_click=set_window, args=(window + 1,), use_container_width=True)
+    except Exception as e:
+        st.error(f"Помилка при відображенні PDF: {str(e)}")
+        st.info("💡 Будь ласка, скористайтесь кнопкою завантаження для перегляду документа")
 
-# Отримання даних з конфігу
-company_name = config.get("company", {}).get("name", "Назва підприємства")
-company_icon = config.get("company", {}).get("icon", "🔥")
+# Частини сторінки, що залежать лише від конфігу, будуються один раз на версію конфігу
+def header_fragment(config):
+    return f'<h1 class="main-header">{config.company.icon} {config.company.name}</h1>'
 
 # Головний заголовок
-st.markdown(f'<h1 class="main-header">{company_icon} {company_name}</h1>', unsafe_allow_html=True)
-
-# Навігаційні пункти з іконками (з конфігу)
-menu_config = config.get("menu", {}).get("items", [])
-if menu_config:
-    menu_items = {f"{item['icon']} {item['label']}": item['label'] for item in menu_config}
-else:
-    # Fallback меню
-    menu_items = {
-        "🏠 Головна": "Головна",
-        "📄 Документи": "Документи",
-        "📸 Фотогалерея": "Фотогалерея",
-        "📞 Контакти": "Контакти"
-    }
-
-# Ініціалізуємо поточну сторінку в session_state
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = "Головна"
-
-# Отримуємо вибір з radio
-selected_menu = st.sidebar.radio(
-    "Оберіть розділ:",
-    list(menu_items.keys()),
-    index=list(menu_items.values()).index(st.session_state.current_page) if st.session_state.current_page in menu_items.values() else 0,
-    label_visibility="collapsed",
-    key="sidebar_menu"
-)
+st.markdown(fragment(tenant.slug, "header", config, header_fragment), unsafe_allow_html=True)
 
-# Оновлюємо поточну сторінку при зміні radio
-selected_page = menu_items[selected_menu]
-if selected_page != st.session_state.current_page:
-    st.session_state.current_page = selected_page
-    st.rerun()
-
-# Отримуємо назву сторінки
-page = st.session_state.current_page
-
-# Завантаження контактів для sidebar з конфігу
-contacts = config.get("contacts", {})
-sidebar_phone = contacts.get("phone", "")
-sidebar_email = contacts.get("email", "")
-
-if sidebar_phone or sidebar_email:
-    st.sidebar.markdown("---")
-    # st.sidebar.markdown("### ⚡ Швидкий контакт")
-    if sidebar_phone:
-        st.sidebar.markdown("📞 **Телефон:**")
-        st.sidebar.markdown(f"_{sidebar_phone}_")
-    if sidebar_email:
-        st.sidebar.markdown("📧 **Email:**")
-        st.sidebar.markdown(f"_{sidebar_email}_")
+# Сторінки реєструються в маршрутизаторі; перехід рендериться без повторного перезапуску
+router = Router("Головна")
 
 # ==================== ГОЛОВНА СТОРІНКА ====================
-if page == "Головна":
-    st.markdown('<h2 class="section-header">Про нас</h2>', unsafe_allow_html=True)
-
-    # Відображення інформації з конфігу
-    company_info = config.get("company", {})
-    display_name = company_info.get("name", "Назва підприємства")
-    company_description = company_info.get("description", "Опис підприємства буде додано пізніше.")
+@router.page("Головна", "home")
+def render_home():
+    def about_fragment(config):
+        # Відображення інформації з конфігу одним елементом
+        return (
+            '<h2 class="section-header">Про нас</h2>\n\n'
+            f"### {config.company.name}\n\n"
+            f"{config.company.description}"
+        )
 
-    st.markdown(f"### {display_name}")
-    st.markdown(company_description)
+    st.markdown(fragment(tenant.slug, "about", config, about_fragment), unsafe_allow_html=True)
 
 
     # === КНОПКИ ШВИДКОЇ НАВІГАЦІЇ ===
@@ -486,219 +147,171 @@ if page == "Головна":
     with btn_col1:
         st.markdown("### 📄 Документи")
         st.markdown("Перегляньте наші офіційні документи та ліцензії")
-        if st.button("Переглянути документи", key="nav_docs", use_container_width=True, type="primary"):
-            st.session_state.current_page = "Документи"
-            st.rerun()
+        st.button("Переглянути документи", key="nav_docs", use_container_width=True, type="primary",
+                  on_click=go_to, args=("Документи",))
         st.markdown('</div>', unsafe_allow_html=True)
 
     with btn_col2:
         st.markdown("### 📸 Фотогалерея")
         st.markdown("Дивіться фотографії нашого обладнання та об'єктів")
-        if st.button("Відкрити галерею", key="nav_photos", use_container_width=True, type="primary"):
-            st.session_state.current_page = "Фотогалерея"
-            st.rerun()
+        st.button("Відкрити галерею", key="nav_photos", use_container_width=True, type="primary",
+                  on_click=go_to, args=("Фотогалерея",))
         st.markdown('</div>', unsafe_allow_html=True)
 
     with btn_col3:
         st.markdown("### 📞 Контакти")
         st.markdown("Зв'яжіться з нами для отримання інформації")
-        if st.button("Наші контакти", key="nav_contacts", use_container_width=True, type="primary"):
-            st.session_state.current_page = "Контакти"
-            st.rerun()
+        st.button("Наші контакти", key="nav_contacts", use_container_width=True, type="primary",
+                  on_click=go_to, args=("Контакти",))
         st.markdown('</div>', unsafe_allow_html=True)
 
 # ==================== ДОКУМЕНТИ ====================
-elif page == "Документи":
+@router.page("Документи", "documents")
+def render_documents():
     st.markdown('<h2 class="section-header">📑 Офіційні документи</h2>', unsafe_allow_html=True)
 
     # Отримання документів з конфігу
-    docs = config.get("documents", {})
-    license1_doc = docs.get("license1", {})
-    license2_doc = docs.get("license2", {})
-    license3_doc = docs.get("license3", {})
-    tariff_doc = docs.get("tariff", {})
-
-    max_pdf_size = config.get("settings", {}).get("max_pdf_size_mb", 10)
-
-    # Створення вкладок для різних документів
-    tab1, tab2, tab3, tab4 = st.tabs([
-        license1_doc.get("title", "Ліцензія 1"),
-        license2_doc.get("title", "Ліцензія 2"),
-        license3_doc.get("title", "Ліцензія 3"),
-        tariff_doc.get("title", "Тарифи на теплопостачання")
-    ])
-
-    with tab1:
-        st.markdown(f"{license1_doc.get('full_title', 'Ліцензія 1')}")
-
-        # Відображення документа
-        license1_path = os.path.join(
-            license1_doc.get("folder", "documents"),
-            license1_doc.get("filename", "Ліцензія1.pdf")
-        )
-
-        if os.path.exists(license1_path):
-            # Читаємо файл один раз
-            with open(license1_path, "rb") as file:
-                license1_pdf_data = file.read()
-
-            # Кнопка завантаження
-            st.download_button(
-                label="⬇️ Завантажити документ",
-                data=license1_pdf_data,
-                file_name=license1_doc.get("filename", "Ліцензія1.pdf"),
-                mime="application/pdf",
-                key="download_license1"
-            )
-
-            st.markdown("#### 📄 Перегляд документа:")
-
-            # Перевіряємо розмір файлу
-            file_size_mb = len(license1_pdf_data) / (1024 * 1024)
-            if file_size_mb > max_pdf_size:
-                st.warning(f"📄 Файл занадто великий ({file_size_mb:.1f} MB) для перегляду в браузері. Будь ласка, завантажте його для перегляду.")
-            else:
-                display_pdf(pdf_data=license1_pdf_data)
-        else:
-            st.warning("📄 Документ не знайдено.")
-
-    with tab2:
-        st.markdown(f"{license2_doc.get('full_title', 'Ліцензія 2')}")
-
-        # Відображення документа
-        license2_path = os.path.join(
-            license2_doc.get("folder", "documents"),
-            license2_doc.get("filename", "Ліцензія2.pdf")
-        )
-
-        if os.path.exists(license2_path):
-            # Читаємо файл один раз
-            with open(license2_path, "rb") as file:
-                license2_pdf_data = file.read()
-
-            # Кнопка завантаження
-            st.download_button(
-                label="⬇️ Завантажити документ",
-                data=license2_pdf_data,
-                file_name=license2_doc.get("filename", "Ліцензія2.pdf"),
-                mime="application/pdf",
-                key="download_license2"
-            )
-
-            st.markdown("#### 📄 Перегляд документа:")
-
-            # Перевіряємо розмір файлу
-            file_size_mb = len(license2_pdf_data) / (1024 * 1024)
-            if file_size_mb > max_pdf_size:
-                st.warning(f"📄 Файл занадто великий ({file_size_mb:.1f} MB) для перегляду в браузері. Будь ласка, завантажте його для перегляду.")
-            else:
-                display_pdf(pdf_data=license2_pdf_data)
-        else:
-            st.warning("📄 Документ не знайдено.")
-
-    with tab3:
-        st.markdown(f"{license3_doc.get('full_title', 'Ліцензія 3')}")
-
-        # Відображення документа
-        license3_path = os.path.join(
-            license3_doc.get("folder", "documents"),
-            license3_doc.get("filename", "Ліцензія3.pdf")
+    docs = {doc.key: doc for doc in config.documents}
+
+    # Документи, більші за цей розмір, показуються вікнами по кілька сторінок
+    pdf_window_size = config.settings.pdf_window_mb
+
+    # Обсяг спільного кешу, з якого сервер віддає документи підприємства
+    get_document_cache(config.settings.document_cache_mb, tenant=tenant.slug)
+
+    def document_path(doc_key):
+        """Шлях до документа; оптимізована копія має перевагу"""
+        return preferred_path(docs[doc_key].path)
+
+    def document_label(doc_key):
+        """Назва документа з розміром; сам файл не читається"""
+        title = docs[doc_key].title
+        path = document_path(doc_key)
+        if os.path.exists(path):
+            return f"{title} · {os.path.getsize(path) / (1024 * 1024):.1f} MB"
+        return title
+
+    # Вибір документа: завантажується та відправляється лише обраний
+    selected_doc = st.radio(
+        "Оберіть документ:",
+        list(docs.keys()),
+        format_func=document_label,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="selected_document"
+    )
+
+    st.markdown(docs[selected_doc].full_title)
+
+    # Відображення документа
+    doc_path = document_path(selected_doc)
+
+    if os.path.exists(doc_path):
+        # Кнопка завантаження: файл віддає сервер з диска, сесія його в пам'яті не тримає
+        st.link_button(
+            "⬇️ Завантажити тариф" if selected_doc.startswith("tariff") else "⬇️ Завантажити документ",
+            file_url(doc_path, tenant.slug, download=True)
         )
 
-        if os.path.exists(license3_path):
-            # Читаємо файл один раз
-            with open(license3_path, "rb") as file:
-                license3_pdf_data = file.read()
-
-            # Кнопка завантаження
-            st.download_button(
-                label="⬇️ Завантажити документ",
-                data=license3_pdf_data,
-                file_name=license3_doc.get("filename", "Ліцензія3.pdf"),
-                mime="application/pdf",
-                key="download_license3"
-            )
-
-            st.markdown("#### 📄 Перегляд документа:")
-
-            # Перевіряємо розмір файлу
-            file_size_mb = len(license3_pdf_data) / (1024 * 1024)
-            if file_size_mb > max_pdf_size:
-                st.warning(f"📄 Файл занадто великий ({file_size_mb:.1f} MB) для перегляду в браузері. Будь ласка, завантажте його для перегляду.")
-            else:
-                display_pdf(pdf_data=license3_pdf_data)
-        else:
-            st.warning("📄 Документ не знайдено.")
-
-    with tab4:
-        st.markdown(f"{tariff_doc.get('full_title', 'Тариф на послуги з теплопостачання')}")
-
-        # Відображення документа
-        tariff_path = os.path.join(
-            tariff_doc.get("folder", "documents"),
-            tariff_doc.get("filename", "Тариф.pdf")
-        )
-
-        if os.path.exists(tariff_path):
-            # Читаємо файл один раз
-            with open(tariff_path, "rb") as file:
-                tariff_pdf_data = file.read()
-
-            # Кнопка завантаження
-            st.download_button(
-                label="⬇️ Завантажити тариф",
-                data=tariff_pdf_data,
-                file_name=tariff_doc.get("filename", "Тариф.pdf"),
-                mime="application/pdf",
-                key="download_tariff"
-            )
-
+        # Значення тарифу з тексту рішення: цифри видно без завантаження PDF
+        tariff_rows = []
+        if selected_doc.startswith("tariff"):
+            with metrics.span("tariffs"):
+                tariff_rows = extract_tariffs(doc_path, tenant.cache_dir("tariffs"), tenant.cache_dir("text"))
+
+        show_pdf = True
+        if tariff_rows:
+            st.markdown("#### 💰 Тарифи:")
+            table = ["| Тариф | Значення | ПДВ |", "|---|---|---|"]
+            table += [f"| {row.name} | **{row.value}** {row.unit} | {row.vat} |" for row in tariff_rows]
+            st.markdown("\n".join(table))
+            pages = ", ".join(str(p) for p in sorted({row.page for row in tariff_rows}))
+            st.caption(f"Значення з тексту документа (с. {pages}). Офіційна редакція - в оригіналі рішення.")
+            show_pdf = st.toggle("📄 Показати оригінал документа", key=f"show_pdf_{selected_doc}")
+
+        if show_pdf:
             st.markdown("#### 📄 Перегляд документа:")
 
             # Перевіряємо розмір файлу
-            file_size_mb = len(tariff_pdf_data) / (1024 * 1024)
-            if file_size_mb > max_pdf_size:
-                st.warning(f"📄 Файл занадто великий ({file_size_mb:.1f} MB) для перегляду в браузері. Будь ласка, завантажте його для перегляду.")
+            file_size_mb = os.path.getsize(doc_path) / (1024 * 1024)
+            if file_size_mb > pdf_window_size:
+                display_pdf_windowed(doc_path, state_key=f"pdf_window_{selected_doc}")
             else:
-                display_pdf(pdf_data=tariff_pdf_data)
-        else:
-            st.warning("📄 Документ не знайдено.")
+                display_pdf(file_path=doc_path)
+    else:
+        st.warning("📄 Документ не знайдено.")
 
 # ==================== ФОТОГАЛЕРЕЯ ====================
-elif page == "Фотогалерея":
+@router.page("Фотогалерея", "gallery")
+def render_gallery():
     st.markdown('<h2 class="section-header">📸 Фотогалерея</h2>', unsafe_allow_html=True)
 
     # Отримання налаштувань галереї з конфігу
-    gallery = config.get("gallery", {})
-    photos_folder = gallery.get("folder", "photos")
-    supported_formats = tuple(gallery.get("supported_formats", [".png", ".jpg", ".jpeg"]))
+    gallery = config.gallery
+    photos_folder = gallery.folder
 
     # Відображення галереї
     if os.path.exists(photos_folder):
-        photo_files = [f for f in os.listdir(photos_folder) if f.lower().endswith(supported_formats)]
+        # Маніфест з розмірами та заглушками; файли фото під час перезапуску не відкриваються
+        with metrics.span("gallery_manifest"):
+            photos = get_manifest(photos_folder, gallery.supported_formats, tenant.cache_dir("images")).photos()
+
+        # Порядок фото може бути заданий у конфігу підприємства; нові фото йдуть після них
+        photo_files = order_photos(photos, gallery.files)
 
         if photo_files:
-            # Відображення фото в одну колонку
-            for photo_file in photo_files:
+            # Посторінковий вивід: обробляються лише мініатюри поточної сторінки
+            page_size = gallery.page_size
+            page_count = (len(photo_files) + page_size - 1) // page_size
+            gallery_page = min(st.session_state.get("gallery_page", 0), page_count - 1)
+            page_files = photo_files[gallery_page * page_size:(gallery_page + 1) * page_size]
+
+            # Повне фото завантажується лише після кліку на мініатюру;
+            # мініатюри поза першим рядком браузер довантажує під час прокрутки,
+            # а до того показується розмита заглушка з маніфесту
+            eager_count = gallery.eager_count
+            thumbnails = []
+            for i, photo_file in enumerate(page_files):
                 image_path = os.path.join(photos_folder, photo_file)
-                image = Image.open(image_path)
-                st.image(image, use_column_width=True)
+                thumbnail = picture_html(
+                    photos[photo_file],
+                    alt=photo_file,
+                    sizes="(max-width: 768px) 50vw, 320px",
+                    variants=("thumb", "mobile"),
+                    lazy=i >= eager_count
+                )
+                thumbnails.append(f'<a href="{file_url(image_path, tenant.slug)}" target="_blank" title="{photo_file}">{thumbnail}</a>')
+            st.markdown(f'<div class="gallery-grid">{"".join(thumbnails)}</div>', unsafe_allow_html=True)
+
+            if page_count > 1:
+                def set_gallery_page(new_page):
+                    st.session_state.gallery_page = new_page
+
+                prev_col, info_col, next_col = st.columns([1, 2, 1])
+                with prev_col:
+                    st.button("⬅️ Попередня", key="gallery_prev", disabled=gallery_page == 0,
+                              on_click=set_gallery_page, args=(gallery_page - 1,), use_container_width=True)
+                with info_col:
+                    st.markdown(f'<p class="photo-caption">Сторінка {gallery_page + 1} з {page_count}</p>', unsafe_allow_html=True)
+                with next_col:
+                    st.button("Наступна ➡️", key="gallery_next", disabled=gallery_page >= page_count - 1,
+                              on_click=set_gallery_page, args=(gallery_page + 1,), use_container_width=True)
         else:
             st.info("📷 Фотографій ще немає в галереї.")
     else:
         st.info("📷 Фотографій ще немає в галереї.")
 
 # ==================== КОНТАКТИ ====================
-elif page == "Контакти":
-    st.markdown('<h2 class="section-header">📞 Контактна інформація</h2>', unsafe_allow_html=True)
-
-    # Завантаження контактів з конфігу
-    contacts_info = config.get("contacts", {})
-    contact_phone = contacts_info.get("phone", "Телефон буде додано")
-    contact_email = contacts_info.get("email", "Email буде додано")
-    contact_address = contacts_info.get("address", "Адреса буде додана")
-
-    st.markdown(f"""
+@router.page("Контакти", "contacts")
+def render_contacts():
+    def contacts_fragment(config):
+        # Завантаження контактів з конфігу
+        contact_phone = config.contacts.phone or "Телефон буде додано"
+        contact_email = config.contacts.email or "Email буде додано"
+        contact_address = config.contacts.address or "Адреса буде додана"
+
+        return f"""
+    <h2 class="section-header">📞 Контактна інформація</h2>
     <div class="contact-item">
         <span class="contact-icon">📞</span>
         <strong>Телефон:</strong>&nbsp;{contact_phone}
@@ -711,27 +324,142 @@ elif page == "Контакти":
         <span class="contact-icon">📍</span>
         <strong>Адреса:</strong>&nbsp;{contact_address}
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+    st.markdown(fragment(tenant.slug, "contacts", config, contacts_fragment), unsafe_allow_html=True)
 
     st.markdown('</div>', unsafe_allow_html=True)
 
-# Футер
-st.markdown("---")
+# ==================== АДМІНІСТРУВАННЯ ====================
+# Сторінки немає в меню: вона відкривається за ?page=admin, якщо задано ADMIN_PASSWORD
+@router.page("Адміністрування", "admin")
+def render_admin():
+    st.markdown('<h2 class="section-header">🔧 Оновлення документів і фото</h2>', unsafe_allow_html=True)
+
+    admin_password = os.environ.get("ADMIN_PASSWORD", "")
+    if not admin_password:
+        st.info("Адміністрування вимкнено: не задано змінну середовища ADMIN_PASSWORD.")
+        return
+
+    if not st.session_state.get("admin_authenticated"):
+        password = st.text_input("Пароль", type="password", key="admin_password")
+        if not password:
+            return
+        if not hmac.compare_digest(password.encode("utf-8"), admin_password.encode("utf-8")):
+            st.error("Невірний пароль")
+            return
+        st.session_state.admin_authenticated = True
+
+    # Файли записуються частинами й атомарно замінюють старі; оптимізація - у фоні
+    st.markdown("#### 📄 Документи")
+    docs = {doc.key: doc for doc in config.documents}
+    doc_key = st.selectbox("Документ", list(docs.keys()), format_func=lambda key: docs[key].title, key="admin_document")
+    doc_file = st.file_uploader("Новий PDF (замінить поточний файл)", type=["pdf"], key="admin_document_file")
+    if doc_file is not None and st.button("Зберегти документ", key="admin_save_document"):
+        doc = docs[doc_key]
+        ingest(tenant, doc_file, doc.folder, "document", filename=doc.filename)
+        st.success(f"Документ «{doc.title}» оновлено. Оптимізована копія готується у фоні.")
+
+    st.markdown("#### 📸 Фотогалерея")
+    photo_uploads = st.file_uploader(
+        "Нові фото",
+        type=[fmt.lstrip(".") for fmt in config.gallery.supported_formats],
+        accept_multiple_files=True,
+        key="admin_photos"
+    )
+    if photo_uploads and st.button("Додати фото", key="admin_save_photos"):
+        for photo in photo_uploads:
+            ingest(tenant, photo, config.gallery.folder, "photo")
+        st.success(f"Додано фото: {len(photo_uploads)}. Зменшені копії готуються у фоні.")
+
+    jobs = recent_jobs(tenant.slug)
+    if jobs:
+        st.markdown("#### ⏳ Фонова обробка")
+        st.table([
+            {
+                "Файл": os.path.basename(job.path),
+                "Стан": job.status,
+                "Час, с": round(job.seconds, 1),
+                "Помилка": job.error or "",
+            }
+            for job in jobs
+        ])
+
+# Навігаційні пункти з іконками (з конфігу)
+menu_items = {f"{item.icon} {item.label}": item.label for item in config.menu}
+menu_keys = {label: key for key, label in menu_items.items()}
 
-# Отримання даних футера з конфігу
-footer_config = config.get("footer", {})
-footer_copyright = footer_config.get("copyright", f"© 2024 {company_name}. Всі права захищено.")
-show_tagline = footer_config.get("show_tagline", False)
-tagline = config.get("company", {}).get("tagline", "Тепло для вашого комфорту")
+# Сторінка цього перезапуску: після кліку вона вже змінена колбеком
+page = router.current()
 
-footer_html = f"""
-    <div style="text-align: center; color: {text_muted}; padding: 1rem;">
-        <p>{footer_copyright}</p>
-"""
+def go_to(label):
+    """Колбек кнопок швидкої навігації: сторінка змінюється до перезапуску"""
+    router.navigate(label)
 
-if show_tagline:
-    footer_html += f"        <p>{company_icon} {tagline}</p>\n"
+# Пункт меню щоразу відповідає поточній сторінці (після кнопок, пошуку чи ?page=);
+# на сторінці поза меню (admin) не позначено жодного, тож клік по будь-якому
+# пункту змінює значення і спрацьовує on_change
+st.session_state.sidebar_menu = menu_keys.get(page)
+
+st.sidebar.radio(
+    "Оберіть розділ:",
+    list(menu_items.keys()),
+    index=None,
+    label_visibility="collapsed",
+    key="sidebar_menu",
+    on_change=lambda: router.navigate(menu_items[st.session_state.sidebar_menu])
+)
+
+# Пошук по тексту документів: відповідає індекс з диска, PDF не відкриваються
+search_query = st.sidebar.text_input(
+    "🔍 Пошук у документах",
+    key="search_query",
+    placeholder="номер ліцензії, тариф, населений пункт"
+)
+if search_query.strip():
+    with metrics.span("search"):
+        search_hits = get_index(tenant).search(search_query)
+    if not search_hits:
+        st.sidebar.caption("Нічого не знайдено")
+    for hit in search_hits:
+        hit_url = file_url(hit.path, tenant.slug)
+        if hit.pages:
+            # Браузерний переглядач PDF відкриває документ одразу на потрібній сторінці
+            pages = ", ".join(f"[{p}]({hit_url}#page={p})" for p in hit.pages[:10])
+            st.sidebar.markdown(f"📄 [{hit.title}]({hit_url}) · с. {pages}")
+        else:
+            st.sidebar.markdown(f"📄 [{hit.title}]({hit_url})")
+        if hit.snippet:
+            st.sidebar.text(hit.snippet)
+
+# Швидкі контакти в sidebar з конфігу
+def sidebar_contacts_fragment(config):
+    lines = []
+    if config.contacts.phone:
+        lines += ["📞 **Телефон:**", f"_{config.contacts.phone}_"]
+    if config.contacts.email:
+        lines += ["📧 **Email:**", f"_{config.contacts.email}_"]
+    return "\n\n".join(["---"] + lines) if lines else ""
+
+sidebar_contacts = fragment(tenant.slug, "sidebar_contacts", config, sidebar_contacts_fragment)
+if sidebar_contacts:
+    st.sidebar.markdown(sidebar_contacts)
+
+# Показ поточної сторінки
+router.render(page)
+
+# Футер з даних конфігу
+def footer_fragment(config):
+    footer_html = f"""---
+
+<div style="text-align: center; color: {config.theme.text_muted}; padding: 1rem;">
+    <p>{config.footer.copyright}</p>
+"""
+    if config.footer.show_tagline:
+        footer_html += f"    <p>{config.company.icon} {config.company.tagline}</p>\n"
+    return footer_html + "</div>"
 
-footer_html += "    </div>"
+st.markdown(fragment(tenant.slug, "footer", config, footer_fragment), unsafe_allow_html=True)
 
-st.markdown(footer_html, unsafe_allow_html=True)
+# Повний час перезапуску (без часу самого Streamlit на відправку повідомлень)
+metrics.observe("rerun", time.perf_counter() - rerun_started)
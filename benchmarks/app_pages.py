@@ -0,0 +1,161 @@
+"""Вимірювання вартості перезапуску app.py для кожної сторінки та підприємства
+
+Запуск з кореня репозиторію:
+    python benchmarks/app_pages.py [--repeat 5] [--threshold 0.25] [--update]
+
+Застосунок запускається без браузера через streamlit.testing.v1.AppTest. Для
+кожного сценарію (підприємство x сторінка) записуються медіанний час
+виконання, пік пам'яті (tracemalloc) і сумарний розмір повідомлень, які
+сервер надіслав би браузеру. Результати порівнюються з benchmarks/baseline.json;
+якщо сценарій погіршився більше ніж на поріг, код виходу 1.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+PAGES = ("Головна", "Документи", "Фотогалерея", "Контакти")
+METRICS = ("wall_ms", "peak_kb", "delta_bytes")
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+# Абсолютний запас для часу, щоб шум на швидких сторінках не давав збоїв
+WALL_SLACK_MS = 10
+
+
+@contextmanager
+def count_delta_bytes():
+    """Підрахунок байтів повідомлень, що ставляться в чергу на відправку браузеру"""
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+    counter = {"bytes": 0}
+    original = ForwardMsgQueue.enqueue
+
+    def enqueue(self, msg):
+        counter["bytes"] += msg.ByteSize()
+        return original(self, msg)
+
+    ForwardMsgQueue.enqueue = enqueue
+    try:
+        yield counter
+    finally:
+        ForwardMsgQueue.enqueue = original
+
+
+def run_page(slug, page, timeout=60):
+    """Один перезапуск app.py для сторінки в новій сесії"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+    at.session_state["tenant"] = slug
+    at.session_state["current_page"] = page
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{slug}/{page}: {at.exception[0].value}")
+    return at
+
+
+def measure(slug, page, repeat=DEFAULT_REPEAT):
+    """Метрики одного сценарію"""
+    # Перший запуск прогріває імпорти та кеші процесу
+    run_page(slug, page)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with count_delta_bytes() as counter:
+            run_page(slug, page)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        run_page(slug, page)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_ms": round(statistics.median(timings), 2),
+        "peak_kb": round(peak / 1024, 1),
+        "delta_bytes": counter["bytes"],
+    }
+
+
+def scenarios(slugs=None, pages=PAGES):
+    from heating.tenants import get_registry
+
+    for slug in slugs or list(get_registry().tenants):
+        for page in pages:
+            yield slug, page
+
+
+def compare(results, baseline, threshold):
+    """Список регресій: (сценарій, метрика, було, стало)"""
+    regressions = []
+    for name, metrics in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in METRICS:
+            before, after = previous.get(metric), metrics[metric]
+            if before is None:
+                continue
+            limit = before * (1 + threshold)
+            if metric == "wall_ms":
+                limit = max(limit, before + WALL_SLACK_MS)
+            if after > limit:
+                regressions.append((name, metric, before, after))
+    return regressions
+
+
+def _load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк сторінок app.py")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="кількість вимірювань часу")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="допустиме погіршення (0.25 = 25%%)")
+    parser.add_argument("--tenants", nargs="*", help="slug підприємств (за замовчуванням усі)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="файл з базовими результатами")
+    parser.add_argument("--update", action="store_true", help="записати результати як нову базу")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    results = {}
+    print(f"{'Сценарій':<36}  {'Час, мс':>9}  {'Пам., KB':>9}  {'Дельти, Б':>10}")
+    for slug, page in scenarios(args.tenants):
+        name = f"{slug}/{page}"
+        results[name] = metrics = measure(slug, page, args.repeat)
+        print(f"{name:<36}  {metrics['wall_ms']:>9.1f}  {metrics['peak_kb']:>9.0f}  {metrics['delta_bytes']:>10}")
+
+    baseline = _load_baseline(args.baseline)
+    if args.update or not baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Базові результати записано в {os.path.relpath(args.baseline, ROOT)}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"❌ {name}: {metric} {before} -> {after}")
+    if regressions:
+        return 1
+    print("✅ Погіршень понад поріг немає")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""Навантаження на локальний сервер Streamlit одночасними сесіями
+
+Запуск з кореня репозиторію:
+    python benchmarks/load_sessions.py --start --sessions 50 [--steps 5] [--think 0.3]
+    python benchmarks/load_sessions.py --port 8501 --pid <pid сервера> --sessions 50
+
+Кожна сесія відкриває websocket /_stcore/stream, як браузер, завантажує
+сайт випадкового підприємства і переходить між сторінками через меню
+(зміна значення радіокнопки sidebar_menu). Вимірюється час від запиту
+перезапуску до повідомлення script_finished. Наприкінці друкуються
+пропускна здатність, перцентилі затримки, RSS сервера та трафік на сесію.
+Працює без інтернету: потрібен лише сервер на цій машині. З --start сервер
+запускається так само, як у продакшні (python -m heating.serve: власні
+маршрути, швидкий шлях для "/" і прогрів), а сесії стартують після /_ready.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = ("Головна", "Документи", "Фотогалерея", "Контакти")
+MENU_KEY = "sidebar_menu"
+RSS_INTERVAL = 0.2
+MAX_MESSAGE_SIZE = 200 * 1024 * 1024
+READY_TIMEOUT = 60
+
+
+class Session:
+    """Одна браузерна сесія: стан віджета меню та лічильники"""
+
+    def __init__(self, port, tenant):
+        self.port = port
+        self.tenant = tenant
+        self.ws = None
+        self.menu_id = None
+        self.menu_options = []
+        self.latencies = []
+        self.bytes = 0
+        self.errors = 0
+
+    async def connect(self):
+        self.ws = await websocket_connect(f"ws://127.0.0.1:{self.port}/_stcore/stream", max_message_size=MAX_MESSAGE_SIZE)
+
+    async def rerun(self, widget_value=None, timeout=60):
+        msg = BackMsg()
+        msg.rerun_script.query_string = f"tenant={self.tenant}"
+        msg.rerun_script.page_script_hash = ""
+        if widget_value is not None and self.menu_id:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.menu_id
+            widget.int_value = widget_value
+
+        started = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            raw = await asyncio.wait_for(self.ws.read_message(), timeout)
+            if raw is None:
+                raise ConnectionError("сервер закрив з'єднання")
+            self.bytes += len(raw)
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                if element.WhichOneof("type") == "radio" and element.radio.id.endswith(MENU_KEY):
+                    self.menu_id = element.radio.id
+                    self.menu_options = list(element.radio.options)
+            elif kind == "script_finished":
+                self.latencies.append(time.perf_counter() - started)
+                return
+
+    async def navigate(self, page):
+        """Вибір сторінки в меню, як клік відвідувача"""
+        for index, option in enumerate(self.menu_options):
+            if option.endswith(page):
+                return await self.rerun(index)
+        return await self.rerun()
+
+
+async def run_session(port, tenant, steps, think, pages, start_gate):
+    session = Session(port, tenant)
+    await start_gate.wait()
+    try:
+        await session.connect()
+        await session.rerun()
+        for _ in range(steps):
+            await asyncio.sleep(random.uniform(0, 2 * think))
+            await session.navigate(random.choice(pages))
+    except Exception:
+        session.errors += 1
+    finally:
+        if session.ws is not None:
+            session.ws.close()
+    return session
+
+
+def read_rss(pid):
+    """Resident set size процесу в байтах (Linux /proc)"""
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+async def sample_rss(pid, samples, stop):
+    while not stop.is_set():
+        rss = read_rss(pid)
+        if rss is not None:
+            samples.append(rss)
+        await asyncio.sleep(RSS_INTERVAL)
+
+
+def start_server(port):
+    """Запуск python -m heating.serve у фоні, як на Railway; повертає процес після прогріву
+
+    /_ready відповідає 200 лише після завершення прогріву, тож сесії не
+    вимірюють холодний старт.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "heating.serve",
+         "--server.port", str(port), "--server.headless", "true"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + READY_TIMEOUT
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Сервер завершився з кодом {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_ready", timeout=1):
+                return process
+        except OSError:
+            # Ще не слухає порт або прогрів не завершено (503)
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"Сервер не прогрівся за {READY_TIMEOUT} с")
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[p - 1]
+
+
+def _tenants():
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from heating.tenants import get_registry
+
+    return list(get_registry().tenants)
+
+
+async def run_load(args, pid):
+    tenants = args.tenants or _tenants()
+    pages = args.pages or list(PAGES)
+    gate = asyncio.Event()
+    rss_samples = []
+    stop = asyncio.Event()
+    sampler = asyncio.ensure_future(sample_rss(pid, rss_samples, stop)) if pid else None
+    rss_before = read_rss(pid) if pid else None
+
+    tasks = [
+        asyncio.ensure_future(run_session(args.port, random.choice(tenants), args.steps, args.think, pages, gate))
+        for _ in range(args.sessions)
+    ]
+    started = time.perf_counter()
+    # Усі сесії стартують одночасно, як відвідувачі після оголошення тарифів
+    gate.set()
+    sessions = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    if sampler is not None:
+        await sampler
+    return sessions, elapsed, rss_before, rss_samples
+
+
+def _format_mb(size):
+    return f"{size / (1024 * 1024):.1f} MB" if size is not None else "-"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Навантажувальний тест сесій Streamlit")
+    parser.add_argument("--port", type=int, default=8501, help="порт сервера")
+    parser.add_argument("--start", action="store_true", help="запустити python -m heating.serve і дочекатися /_ready")
+    parser.add_argument("--pid", type=int, help="pid сервера для вимірювання RSS")
+    parser.add_argument("--sessions", type=int, default=20, help="кількість одночасних сесій")
+    parser.add_argument("--steps", type=int, default=5, help="переходів між сторінками в сесії")
+    parser.add_argument("--think", type=float, default=0.3, help="середня пауза між переходами, с")
+    parser.add_argument("--tenants", nargs="*", help="slug підприємств (за замовчуванням усі)")
+    parser.add_argument("--pages", nargs="*", choices=PAGES, help="сторінки для переходів")
+    parser.add_argument("--seed", type=int, help="зерно генератора для відтворюваності")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    process = start_server(args.port) if args.start else None
+    pid = process.pid if process else args.pid
+    try:
+        sessions, elapsed, rss_before, rss_samples = asyncio.run(run_load(args, pid))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies = sorted(latency * 1000 for s in sessions for latency in s.latencies)
+    reruns = len(latencies)
+    errors = sum(s.errors for s in sessions)
+    total_bytes = sum(s.bytes for s in sessions)
+
+    print(f"Сесій: {len(sessions)}, перезапусків: {reruns}, помилок: {errors}, час: {elapsed:.2f} с")
+    print(f"Пропускна здатність: {reruns / elapsed:.1f} перезапусків/с")
+    print(f"Затримка, мс: p50 {percentile(latencies, 50):.1f}  p95 {percentile(latencies, 95):.1f}  "
+          f"p99 {percentile(latencies, 99):.1f}  max {max(latencies, default=0):.1f}")
+    print(f"Трафік: {total_bytes / max(len(sessions), 1) / 1024:.1f} KB на сесію, "
+          f"{total_bytes / max(reruns, 1) / 1024:.1f} KB на перезапуск")
+    if pid:
+        print(f"RSS сервера: до {_format_mb(rss_before)}, пік {_format_mb(max(rss_samples, default=None))}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Допоміжні модулі сайту підприємства теплопостачання"""
@@ -0,0 +1,212 @@
+"""Файли статичних сайтів з хешем вмісту в імені та стиснутими копіями
+
+Запуск: python -m heating.assets каталог  (або python -m heating.export --out каталог --fingerprint)
+
+Для кожного файлу, на який посилаються згенеровані index.html, створюється
+копія з хешем вмісту в імені (style.3f2a9c1b0d4e.css), посилання в HTML
+переписуються на неї, а поруч з HTML, CSS і PDF кладуться .gz (і .br, якщо
+встановлено brotli). Такі файли можна кешувати назавжди: зміна вмісту дає
+нове ім'я. Відповідність імен записується в asset-manifest.json.
+
+Каталог має бути окремим від папок підприємств: копії з хешем у самих папках
+документів і фото галерея та пошук сприйняли б як нові файли.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from urllib.parse import quote, unquote
+
+from heating.atomic import write_atomic
+from heating.config import ConfigError
+from heating.sizes import format_size
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_FILENAME = "asset-manifest.json"
+HASH_LENGTH = 12
+COMPRESSIBLE = (".html", ".css", ".pdf")
+# Стиснута копія, що економить менше цієї частки, не зберігається
+MIN_SAVING = 0.05
+
+ATTRIBUTE_RE = re.compile(r'\b(href|src)="([^"#?]+)"')
+HASHED_NAME_RE = re.compile(r"^(.*)\.[0-9a-f]{%d}(\.[^.]+)$" % HASH_LENGTH)
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(path):
+    """Ім'я копії з хешем вмісту: Тариф.pdf -> Тариф.<hash>.pdf"""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    return f"{stem}.{_file_hash(path)}{ext}"
+
+
+def _original_path(path):
+    """Шлях до оригіналу для вже переписаного посилання на копію з хешем"""
+    folder, name = os.path.split(path)
+    match = HASHED_NAME_RE.match(name)
+    if match:
+        original = os.path.join(folder, match.group(1) + match.group(2))
+        if os.path.isfile(original):
+            return original
+    return path
+
+
+def _resolve(out_dir, html_path, url):
+    """Локальний файл, на який вказує посилання зі сторінки, або None"""
+    if "://" in url or url.startswith(("mailto:", "tel:", "data:", "//")):
+        return None
+    url = unquote(url)
+    if url.startswith("/"):
+        path = os.path.join(out_dir, url.lstrip("/"))
+    else:
+        path = os.path.join(os.path.dirname(html_path), url)
+    path = _original_path(os.path.normpath(path))
+    if not os.path.isfile(path) or path.endswith(".html"):
+        return None
+    return path
+
+
+def find_pages(out_dir):
+    """Усі index.html у каталозі експорту"""
+    for folder, dirnames, filenames in os.walk(out_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        if "index.html" in filenames:
+            yield os.path.join(folder, "index.html")
+
+
+def compress(path):
+    """Створення .gz (і .br) поруч з файлом; повертає розміри стиснутих копій"""
+    size = os.path.getsize(path)
+    encoders = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoders[".br"] = lambda data: brotli.compress(data, quality=11)
+
+    sizes = {}
+    data = None
+    for suffix, encode in encoders.items():
+        target = path + suffix
+        if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+            sizes[suffix] = os.path.getsize(target)
+            continue
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        encoded = encode(data)
+        if len(encoded) > size * (1 - MIN_SAVING):
+            # Вже стиснуті PDF та фото майже не зменшуються
+            if os.path.exists(target):
+                os.remove(target)
+            continue
+        write_atomic(target, encoded)
+        sizes[suffix] = len(encoded)
+    return sizes
+
+
+def source_folders():
+    """Папки документів і фото всіх підприємств"""
+    from heating.tenants import get_registry
+
+    folders = set()
+    for tenant in get_registry().tenants.values():
+        try:
+            config = tenant.config
+        except ConfigError:
+            continue
+        folders.add(os.path.abspath(config.gallery.folder))
+        folders.update(os.path.abspath(doc.folder) for doc in config.documents)
+    return folders
+
+
+def check_out_dir(out_dir):
+    """ValueError, якщо в каталозі лежать папки документів або фото підприємств"""
+    out_dir = os.path.abspath(out_dir)
+    inside = sorted(folder for folder in source_folders() if os.path.commonpath([folder, out_dir]) == out_dir)
+    if inside:
+        raise ValueError(
+            f"Каталог {out_dir} містить папки підприємств ({os.path.relpath(inside[0])}); "
+            "для копій з хешем потрібен окремий каталог експорту (--out)"
+        )
+
+
+def fingerprint(out_dir):
+    """Копії з хешем, переписані посилання, стиснення і маніфест; повертає маніфест"""
+    check_out_dir(out_dir)
+    out_dir = os.path.normpath(out_dir)
+    manifest = {}
+
+    def asset_entry(path):
+        key = os.path.relpath(path, out_dir)
+        if key not in manifest:
+            target = os.path.join(os.path.dirname(path), hashed_name(path))
+            if not os.path.exists(target):
+                shutil.copy2(path, target)
+            entry = {"hashed": os.path.relpath(target, out_dir), "size": os.path.getsize(path)}
+            if path.lower().endswith(COMPRESSIBLE):
+                entry.update({suffix.lstrip("."): size for suffix, size in compress(target).items()})
+            manifest[key] = entry
+        return manifest[key]
+
+    for html_path in find_pages(out_dir):
+        with open(html_path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        def rewrite(match):
+            attribute, url = match.groups()
+            path = _resolve(out_dir, html_path, url)
+            if path is None:
+                return match.group(0)
+            hashed = os.path.basename(asset_entry(path)["hashed"])
+            if "%" in url:
+                hashed = quote(hashed)
+            prefix = url[:url.rfind("/") + 1]
+            return f'{attribute}="{prefix}{hashed}"'
+
+        rewritten = ATTRIBUTE_RE.sub(rewrite, html)
+        if rewritten != html:
+            write_atomic(html_path, rewritten)
+        page_key = os.path.relpath(html_path, out_dir)
+        manifest[page_key] = {"hashed": page_key, "size": os.path.getsize(html_path)}
+        manifest[page_key].update({suffix.lstrip("."): size for suffix, size in compress(html_path).items()})
+
+    manifest = dict(sorted(manifest.items()))
+    write_atomic(os.path.join(out_dir, MANIFEST_FILENAME), json.dumps(manifest, ensure_ascii=False, indent=2))
+    return manifest
+
+
+def print_report(manifest):
+    """Підсумок: кількість файлів, розмір до стиснення і після"""
+    total = sum(entry["size"] for entry in manifest.values())
+    compressed = sum(entry.get("br", entry.get("gz", entry["size"])) for entry in manifest.values())
+    print(f"Файлів: {len(manifest)}, розмір: {format_size(total)}, стиснуто: {format_size(compressed)}")
+    if brotli is None:
+        print("brotli не встановлено - створено лише .gz")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Використання: python -m heating.assets каталог", file=sys.stderr)
+        return 2
+    try:
+        print_report(fingerprint(argv[0]))
+    except ValueError as e:
+        print(f"⚠️  {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
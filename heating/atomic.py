@@ -0,0 +1,46 @@
+"""Атомарний запис файлів кешу та згенерованих сторінок
+
+Файл спершу пишеться поруч під тимчасовим ім'ям і лише потім одним
+os.replace займає своє місце, тож інші потоки й процеси бачать або стару
+версію, або нову цілком. Якщо запис перервався, тимчасовий файл видаляється.
+"""
+import contextlib
+import json
+import os
+import threading
+
+
+@contextlib.contextmanager
+def atomic_path(target):
+    """Тимчасовий шлях поруч з target; після успішного блоку він замінює target"""
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextlib.contextmanager
+def atomic_write(target, mode="w", fsync=False):
+    """Файл для запису, що займає місце target після закриття; fsync=True - з fsync"""
+    with atomic_path(target) as tmp_path:
+        with open(tmp_path, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def write_atomic(target, content):
+    """Запис тексту або байтів"""
+    with atomic_write(target, "wb" if isinstance(content, bytes) else "w") as f:
+        f.write(content)
+
+
+def write_json(target, data):
+    """Запис JSON з українським текстом без екранування"""
+    with atomic_write(target) as f:
+        json.dump(data, f, ensure_ascii=False)
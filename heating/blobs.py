@@ -0,0 +1,155 @@
+"""Спільне сховище файлів підприємств за SHA-256 вмісту
+
+Кожен файл, який віддає сервер (документи, фото, стилі), потрапляє в
+<cache_dir>/blobs/<ab>/<sha256><розширення> - жорстким посиланням на оригінал,
+а якщо це неможливо (інша файлова система) - копією. Однакові файли різних
+підприємств стають одним blob: одна адреса /_files і один запис у кеші.
+
+Звіт про дублікати в папках підприємств і заощаджені байти:
+    python -m heating.blobs [--link] [--root каталог]
+З --link дублікати замінюються жорсткими посиланнями на blob.
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import threading
+
+from heating.atomic import atomic_path
+from heating.sizes import format_size
+
+BLOBS_DIR = "blobs"
+
+_hashes = {}
+_blobs = {}
+_lock = threading.Lock()
+
+
+def content_hash(path):
+    """SHA-256 вмісту файлу, обчислений один раз на версію"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        digest = _hashes.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        with _lock:
+            _hashes[key] = digest
+    return digest
+
+
+def default_root():
+    """Каталог сховища в cache_dir підприємства за замовчуванням (сховище одне на процес)"""
+    from heating.tenants import get_registry
+
+    return os.path.join(get_registry().resolve().config.settings.cache_dir, BLOBS_DIR)
+
+
+def blob_path(digest, extension="", root=None):
+    return os.path.join(root or default_root(), digest[:2], digest + extension.lower())
+
+
+def _link_or_copy(source, target):
+    with atomic_path(target) as tmp_path:
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+
+
+def current_blob(path, root=None):
+    """Шлях до blob поточної версії файлу, не створюючи його"""
+    return blob_path(content_hash(path), os.path.splitext(path)[1], root)
+
+
+def store(path, root=None):
+    """Шлях до blob з тим самим вмістом; створюється при першому зверненні"""
+    digest = content_hash(path)
+    target = current_blob(path, root)
+    # Жорстке посилання змінюється разом з оригіналом, якщо той переписали на місці
+    if not os.path.exists(target) or content_hash(target) != digest:
+        _link_or_copy(path, target)
+    with _lock:
+        _blobs.setdefault(target, set()).add(os.path.abspath(path))
+    return target
+
+
+def stats():
+    """Скільки шляхів процес звів до скількох blob"""
+    with _lock:
+        return {
+            "blobs": len(_blobs),
+            "blob_paths": sum(len(paths) for paths in _blobs.values()),
+            "shared_blobs": sum(1 for paths in _blobs.values() if len(paths) > 1),
+        }
+
+
+def tenant_files(tenant):
+    """Документи та фото підприємства, що існують на диску"""
+    # Імпорт тут: heating.optimize_pdfs тягне pypdf, а сховище потрібне й без нього
+    from heating.optimize_pdfs import optimized_path
+    from heating.static_site import gallery_files
+
+    config = tenant.config
+    paths = []
+    for doc in config.documents:
+        paths += [doc.path, optimized_path(doc.path)]
+    paths += [os.path.join(config.gallery.folder, photo) for photo in gallery_files(config)]
+    return [path for path in dict.fromkeys(paths) if os.path.isfile(path)]
+
+
+def deduplicate(paths, root=None, link=False):
+    """Рядки звіту (шлях, розмір, blob, вже спільний) і кількість заощаджених байтів"""
+    rows = []
+    saved = 0
+    for path in paths:
+        target = store(path, root)
+        shared = os.path.samefile(path, target)
+        if not shared and link:
+            _link_or_copy(target, path)
+            shared = os.path.samefile(path, target)
+        size = os.path.getsize(path)
+        if shared:
+            saved += size
+        rows.append((path, size, target, shared))
+    # Один екземпляр кожного blob потрібен у будь-якому разі
+    unique = {}
+    for path, size, target, shared in rows:
+        if shared:
+            unique[target] = size
+    return rows, saved - sum(unique.values())
+
+
+def main(argv=None):
+    from heating.tenants import get_registry
+
+    parser = argparse.ArgumentParser(description="Спільне сховище файлів підприємств")
+    parser.add_argument("--root", help="каталог сховища (за замовчуванням <cache_dir>/blobs)")
+    parser.add_argument("--link", action="store_true", help="замінити дублікати жорсткими посиланнями")
+    args = parser.parse_args(argv)
+
+    paths = []
+    for tenant in get_registry().tenants.values():
+        paths += tenant_files(tenant)
+    paths = list(dict.fromkeys(os.path.abspath(path) for path in paths))
+    rows, saved = deduplicate(paths, args.root, args.link)
+
+    total = sum(size for _, size, _, _ in rows)
+    blobs = {target: size for _, size, target, _ in rows}
+    duplicates = total - sum(blobs.values())
+    print(f"Файлів: {len(rows)}, унікальних: {len(blobs)}, {format_size(total)} -> {format_size(sum(blobs.values()))}")
+    print(f"Дублікатів: {format_size(duplicates)}; заощаджено жорсткими посиланнями: {format_size(saved)}")
+    for target in blobs:
+        names = [os.path.relpath(path) for path, _, t, _ in rows if t == target]
+        if len(names) > 1:
+            print(f"  {os.path.basename(target)[:16]}: " + ", ".join(names))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
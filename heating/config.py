@@ -0,0 +1,338 @@
+"""Типізований знімок конфігурації з перезавантаженням за зміною mtime"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+COLOR_RE = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
+
+
+class ConfigError(ValueError):
+    """Помилка в конфігурації; попередній знімок залишається чинним"""
+
+
+@dataclass(frozen=True)
+class Company:
+    name: str = "Назва підприємства"
+    icon: str = "🔥"
+    tagline: str = "Тепло для вашого комфорту"
+    description: str = "Опис підприємства буде додано пізніше."
+    short_name: str = ""
+
+
+@dataclass(frozen=True)
+class Contacts:
+    phone: str = ""
+    email: str = ""
+    address: str = ""
+    phone_raw: str = ""
+
+
+@dataclass(frozen=True)
+class Document:
+    key: str
+    title: str
+    full_title: str
+    filename: str
+    folder: str = "documents"
+
+    @property
+    def path(self):
+        return os.path.join(self.folder, self.filename)
+
+
+@dataclass(frozen=True)
+class MenuItem:
+    icon: str
+    label: str
+
+
+@dataclass(frozen=True)
+class Gallery:
+    folder: str = "photos"
+    supported_formats: Tuple[str, ...] = (".png", ".jpg", ".jpeg")
+    page_size: int = 12
+    eager_count: int = 4
+    files: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Theme:
+    primary_color: str = "#FF6B35"
+    secondary_color: str = "#E55A2B"
+    text_color: str = "#2E4053"
+    background_light: str = "#F0F2F6"
+    text_muted: str = "#5D6D7E"
+    primary_light: str = ""
+    style_variant: str = "classic"
+
+
+@dataclass(frozen=True)
+class Footer:
+    copyright: str = ""
+    show_tagline: bool = False
+
+
+@dataclass(frozen=True)
+class Settings:
+    pdf_viewer_height: str = "800px"
+    pdf_window_mb: float = 2
+    pdf_window_pages: int = 5
+    document_cache_mb: float = 64
+    cache_dir: str = ".cache"
+    metrics: bool = True
+    metrics_trace: str = ""
+    fast_path: bool = True
+
+
+# Документи за замовчуванням, якщо в конфігу немає розділу [documents]
+DEFAULT_DOCUMENTS = (
+    Document("license1", "Ліцензія 1", "Ліцензія 1", "Ліцензія1.pdf"),
+    Document("license2", "Ліцензія 2", "Ліцензія 2", "Ліцензія2.pdf"),
+    Document("license3", "Ліцензія 3", "Ліцензія 3", "Ліцензія3.pdf"),
+    Document("tariff", "Тарифи на теплопостачання", "Тариф на послуги з теплопостачання", "Тариф.pdf"),
+)
+
+DEFAULT_MENU = (
+    MenuItem("🏠", "Головна"),
+    MenuItem("📄", "Документи"),
+    MenuItem("📸", "Фотогалерея"),
+    MenuItem("📞", "Контакти"),
+)
+
+
+@dataclass(frozen=True)
+class SiteConfig:
+    company: Company
+    contacts: Contacts
+    documents: Tuple[Document, ...]
+    menu: Tuple[MenuItem, ...]
+    gallery: Gallery
+    theme: Theme
+    footer: Footer
+    settings: Settings
+    raw: Dict = field(compare=False, repr=False)
+    hash: str = ""
+
+    def document(self, key):
+        for doc in self.documents:
+            if doc.key == key:
+                return doc
+        return None
+
+
+def _section(raw, name):
+    value = raw.get(name, {})
+    if not isinstance(value, dict):
+        raise ConfigError(f"[{name}] має бути таблицею")
+    return value
+
+
+def _string(section, name, key, default):
+    value = section.get(key, default)
+    if not isinstance(value, str):
+        raise ConfigError(f"{name}.{key} має бути рядком")
+    return value
+
+
+def _number(section, name, key, default, cast=float, minimum=0):
+    value = section.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ConfigError(f"{name}.{key} має бути числом")
+    if value <= minimum:
+        raise ConfigError(f"{name}.{key} має бути більшим за {minimum}")
+    return cast(value)
+
+
+def _color(section, name, key, default):
+    value = _string(section, name, key, default)
+    if value and not COLOR_RE.match(value):
+        raise ConfigError(f"{name}.{key}: некоректний колір {value!r}")
+    return value
+
+
+def config_hash(raw):
+    """Стабільний хеш вмісту конфігурації"""
+    canonical = json.dumps(raw, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_config(raw):
+    """Перевірка сирого словника конфігурації та побудова SiteConfig"""
+    if not isinstance(raw, dict):
+        raise ConfigError("Конфігурація має бути таблицею")
+
+    company_raw = _section(raw, "company")
+    defaults = Company()
+    company = Company(
+        name=_string(company_raw, "company", "name", defaults.name),
+        icon=_string(company_raw, "company", "icon", defaults.icon),
+        tagline=_string(company_raw, "company", "tagline", defaults.tagline),
+        description=_string(company_raw, "company", "description", defaults.description),
+        short_name=_string(company_raw, "company", "short_name", ""),
+    )
+
+    contacts_raw = _section(raw, "contacts")
+    contacts = Contacts(**{
+        key: _string(contacts_raw, "contacts", key, "")
+        for key in ("phone", "email", "address", "phone_raw")
+    })
+
+    documents = []
+    for key, doc in _section(raw, "documents").items():
+        if not isinstance(doc, dict):
+            raise ConfigError(f"[documents.{key}] має бути таблицею")
+        name = f"documents.{key}"
+        title = _string(doc, name, "title", key)
+        documents.append(Document(
+            key=key,
+            title=title,
+            full_title=_string(doc, name, "full_title", title),
+            filename=_string(doc, name, "filename", f"{key}.pdf"),
+            folder=_string(doc, name, "folder", "documents"),
+        ))
+
+    menu_items = _section(raw, "menu").get("items", [])
+    if not isinstance(menu_items, list) or not all(
+        isinstance(item, dict) and "label" in item for item in menu_items
+    ):
+        raise ConfigError("menu.items має бути списком з полями icon та label")
+    menu = tuple(MenuItem(str(item.get("icon", "")), str(item["label"])) for item in menu_items)
+
+    gallery_raw = _section(raw, "gallery")
+    formats = gallery_raw.get("supported_formats", list(Gallery.supported_formats))
+    files = gallery_raw.get("files", [])
+    if not isinstance(formats, list) or not isinstance(files, list):
+        raise ConfigError("gallery.supported_formats та gallery.files мають бути списками")
+    gallery = Gallery(
+        folder=_string(gallery_raw, "gallery", "folder", Gallery.folder),
+        supported_formats=tuple(str(f).lower() for f in formats),
+        page_size=_number(gallery_raw, "gallery", "page_size", Gallery.page_size, int),
+        eager_count=_number(gallery_raw, "gallery", "eager_count", Gallery.eager_count, int, minimum=-1),
+        files=tuple(str(f) for f in files),
+    )
+
+    theme_raw = _section(raw, "theme")
+    theme = Theme(
+        primary_color=_color(theme_raw, "theme", "primary_color", Theme.primary_color),
+        secondary_color=_color(theme_raw, "theme", "secondary_color", Theme.secondary_color),
+        text_color=_color(theme_raw, "theme", "text_color", Theme.text_color),
+        background_light=_color(theme_raw, "theme", "background_light", Theme.background_light),
+        text_muted=_color(theme_raw, "theme", "text_muted", Theme.text_muted),
+        primary_light=_color(theme_raw, "theme", "primary_light", ""),
+        style_variant=_string(theme_raw, "theme", "style_variant", Theme.style_variant),
+    )
+
+    footer_raw = _section(raw, "footer")
+    show_tagline = footer_raw.get("show_tagline", False)
+    if not isinstance(show_tagline, bool):
+        raise ConfigError("footer.show_tagline має бути true або false")
+    footer = Footer(
+        copyright=_string(footer_raw, "footer", "copyright", f"© 2024 {company.name}. Всі права захищено."),
+        show_tagline=show_tagline,
+    )
+
+    settings_raw = _section(raw, "settings")
+    metrics = settings_raw.get("metrics", Settings.metrics)
+    if not isinstance(metrics, bool):
+        raise ConfigError("settings.metrics має бути true або false")
+    fast_path = settings_raw.get("fast_path", Settings.fast_path)
+    if not isinstance(fast_path, bool):
+        raise ConfigError("settings.fast_path має бути true або false")
+    settings = Settings(
+        pdf_viewer_height=_string(settings_raw, "settings", "pdf_viewer_height", Settings.pdf_viewer_height),
+        pdf_window_mb=_number(settings_raw, "settings", "pdf_window_mb", Settings.pdf_window_mb),
+        pdf_window_pages=_number(settings_raw, "settings", "pdf_window_pages", Settings.pdf_window_pages, int),
+        document_cache_mb=_number(settings_raw, "settings", "document_cache_mb", Settings.document_cache_mb),
+        cache_dir=_string(settings_raw, "settings", "cache_dir", Settings.cache_dir),
+        metrics=metrics,
+        metrics_trace=_string(settings_raw, "settings", "metrics_trace", Settings.metrics_trace),
+        fast_path=fast_path,
+    )
+
+    return SiteConfig(
+        company=company,
+        contacts=contacts,
+        documents=tuple(documents) or DEFAULT_DOCUMENTS,
+        menu=menu or DEFAULT_MENU,
+        gallery=gallery,
+        theme=theme,
+        footer=footer,
+        settings=settings,
+        raw=raw,
+        hash=config_hash(raw),
+    )
+
+
+class ConfigStore:
+    """Знімок конфігурації, спільний для всіх сесій
+
+    Файли перечитуються лише при зміні їхнього mtime. Якщо нова версія не
+    розбирається або не проходить перевірку, залишається попередній знімок.
+    """
+
+    def __init__(self, paths, build):
+        self.paths = tuple(paths)
+        self._build = build
+        self._lock = threading.Lock()
+        self._snapshot: Optional[SiteConfig] = None
+        self._mtimes = None
+        self.reload_count = 0
+        self.error_count = 0
+        self.last_parse_seconds = 0.0
+        self.last_error = None
+
+    def _current_mtimes(self):
+        mtimes = []
+        for path in self.paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def get(self):
+        """Чинний знімок; при зміні файлів - спроба перезавантаження"""
+        mtimes = self._current_mtimes()
+        if mtimes == self._mtimes and self._snapshot is not None:
+            return self._snapshot
+
+        with self._lock:
+            if mtimes == self._mtimes and self._snapshot is not None:
+                return self._snapshot
+            started = time.perf_counter()
+            try:
+                snapshot = parse_config(self._build())
+            except Exception as e:
+                self.error_count += 1
+                self.last_error = str(e)
+                # Запам'ятовуємо mtime, щоб не розбирати зламаний файл на кожному перезапуску
+                self._mtimes = mtimes
+                if self._snapshot is None:
+                    raise ConfigError(f"Не вдалося завантажити конфігурацію: {e}") from e
+                logger.warning("Конфігурацію %s відхилено, залишено попередню: %s", self.paths, e)
+                return self._snapshot
+
+            self.last_parse_seconds = time.perf_counter() - started
+            self.last_error = None
+            self.reload_count += 1
+            self._snapshot = snapshot
+            self._mtimes = mtimes
+            return snapshot
+
+    def stats(self):
+        return {
+            "paths": list(self.paths),
+            "reload_count": self.reload_count,
+            "error_count": self.error_count,
+            "last_parse_seconds": self.last_parse_seconds,
+            "last_error": self.last_error,
+            "hash": self._snapshot.hash if self._snapshot else None,
+        }
@@ -0,0 +1,138 @@
+"""Спільний для всіх сесій кеш вмісту документів"""
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_BUDGET_MB = 64
+
+
+class DocumentCache:
+    """LRU-кеш байтів файлів з ключем (шлях, mtime, розмір) та обмеженням пам'яті"""
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()
+        self._keys_by_path = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_read = 0
+        self.bytes_cached = 0
+
+    @staticmethod
+    def make_key(path):
+        """Ключ кешу для поточної версії файлу"""
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path):
+        """Повертає вміст файлу; з диску читає лише нову або змінену версію"""
+        key = self.make_key(path)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        with self._lock:
+            self.bytes_read += len(data)
+            self._store(key, data)
+        return data
+
+    def _store(self, key, data):
+        # Стара версія того ж файлу більше не знадобиться
+        old_key = self._keys_by_path.get(key[0])
+        if old_key is not None and old_key != key:
+            self._discard(old_key)
+
+        if len(data) > self.budget_bytes or key in self._entries:
+            return
+
+        self._entries[key] = data
+        self._keys_by_path[key[0]] = key
+        self.bytes_cached += len(data)
+        self._trim()
+
+    def _discard(self, key):
+        data = self._entries.pop(key, None)
+        if data is not None:
+            self.bytes_cached -= len(data)
+        if self._keys_by_path.get(key[0]) == key:
+            del self._keys_by_path[key[0]]
+
+    def _trim(self):
+        while self.bytes_cached > self.budget_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes):
+        """Зміна обмеження пам'яті з витісненням зайвих записів"""
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._trim()
+
+    def invalidate(self, path=None):
+        """Видалення з кешу одного файлу або всього вмісту"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._keys_by_path.clear()
+                self.bytes_cached = 0
+                return
+            key = self._keys_by_path.get(os.path.abspath(path))
+            if key is not None:
+                self._discard(key)
+
+    def stats(self):
+        """Лічильники влучань, промахів та використаної пам'яті"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes_cached": self.bytes_cached,
+                "bytes_read": self.bytes_read,
+                "budget_bytes": self.budget_bytes,
+            }
+
+
+_caches = {}
+_cache_lock = threading.Lock()
+
+
+def get_document_cache(budget_mb=None, tenant=None):
+    """Екземпляр кешу документів, спільний для всіх сесій одного підприємства
+
+    Обмеження пам'яті змінюється лише тоді, коли його передано явно; без нього
+    новий кеш отримує DEFAULT_BUDGET_MB, а наявний зберігає своє.
+    """
+    budget_bytes = int((DEFAULT_BUDGET_MB if budget_mb is None else budget_mb) * 1024 * 1024)
+    with _cache_lock:
+        cache = _caches.get(tenant)
+        if cache is None:
+            cache = _caches[tenant] = DocumentCache(budget_bytes)
+        elif budget_mb is not None and cache.budget_bytes != budget_bytes:
+            cache.set_budget(budget_bytes)
+        return cache
+
+
+def all_document_caches():
+    """Кеші всіх підприємств (для статистики)"""
+    with _cache_lock:
+        return dict(_caches)
+
+
+def invalidate_everywhere(path):
+    """Видалення файлу з кешів усіх підприємств і спільного кешу"""
+    with _cache_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.invalidate(path)
@@ -0,0 +1,175 @@
+"""Експорт статичних сайтів підприємств у HTML (заміна build.js)
+
+Запуск: python -m heating.export [--out .] [--tenants slug ...] [--jobs N] [--force] [--fingerprint]
+(--fingerprint - лише з окремим каталогом --out, не з папками підприємств)
+
+Сторінка перезаписується лише тоді, коли змінився хеш її вхідних даних:
+конфігурації, шаблону та списку файлів (документів або фото). Сайти
+будуються паралельно в окремих процесах.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from heating import static_site
+from heating.atomic import write_atomic
+from heating.assets import check_out_dir, fingerprint, print_report
+from heating.static_site import PAGE_FILES, PAGES, gallery_files, render_page
+from heating.tenants import DEFAULT_SLUG, get_registry
+
+STATE_FILENAME = "export-state.json"
+SHARED_FILES = ("style.css",)
+
+
+def _template_hash():
+    with open(static_site.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [path, None, None]
+    return [path, stat.st_size, stat.st_mtime_ns]
+
+
+def page_assets(config, page):
+    """Файли, від яких залежить сторінка"""
+    if page == "Документи":
+        return [doc.path for doc in config.documents]
+    if page == "Фотогалерея":
+        return [os.path.join(config.gallery.folder, photo) for photo in gallery_files(config)]
+    return []
+
+
+def page_hash(config, page, template_hash):
+    """Хеш вхідних даних сторінки: конфіг, шаблон і список файлів"""
+    payload = json.dumps(
+        [config.hash, template_hash, page, [_file_signature(p) for p in page_assets(config, page)]],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _copy_if_changed(source, target):
+    """Копіювання файлу, якщо копії немає або вона відрізняється розміром чи mtime"""
+    try:
+        source_stat = os.stat(source)
+    except OSError:
+        return False
+    try:
+        target_stat = os.stat(target)
+        if target_stat.st_size == source_stat.st_size and target_stat.st_mtime_ns == source_stat.st_mtime_ns:
+            return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    shutil.copy2(source, target)
+    return True
+
+
+def build_site(slug, out_dir, previous, force=False):
+    """Побудова одного сайту; виконується в окремому процесі
+
+    Повертає (slug, нові хеші сторінок, кількість перебудованих, пропущених, секунди).
+    """
+    started = time.perf_counter()
+    config = get_registry().get(slug).config
+    template_hash = _template_hash()
+    same_tree = os.path.abspath(out_dir) == os.path.abspath(".")
+
+    hashes = {}
+    built = skipped = 0
+    for page in PAGES:
+        target = os.path.join(out_dir, slug, PAGE_FILES[page][0])
+        digest = page_hash(config, page, template_hash)
+        hashes[page] = digest
+        if not force and previous.get(page) == digest and os.path.exists(target):
+            skipped += 1
+            continue
+        write_atomic(target, render_page(config, slug, page))
+        built += 1
+
+    if not same_tree:
+        for page in ("Документи", "Фотогалерея"):
+            for path in page_assets(config, page):
+                _copy_if_changed(path, os.path.join(out_dir, path))
+
+    return slug, hashes, built, skipped, time.perf_counter() - started
+
+
+def _load_state(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def export(out_dir=".", slugs=None, jobs=None, force=False):
+    """Експорт сайтів; повертає список результатів build_site"""
+    registry = get_registry()
+    slugs = slugs or [slug for slug in registry.tenants if slug != DEFAULT_SLUG]
+    unknown = [slug for slug in slugs if registry.get(slug) is None]
+    if unknown:
+        raise ValueError(f"Невідомі підприємства: {', '.join(unknown)}")
+
+    state_path = os.path.join(registry.get(DEFAULT_SLUG).config.settings.cache_dir, STATE_FILENAME)
+    state = _load_state(state_path)
+    out_key = os.path.abspath(out_dir)
+    out_state = state.setdefault(out_key, {})
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(build_site, slug, out_dir, out_state.get(slug, {}), force)
+            for slug in slugs
+        ]
+        results = [future.result() for future in futures]
+
+    if os.path.abspath(out_dir) != os.path.abspath("."):
+        for filename in SHARED_FILES:
+            _copy_if_changed(filename, os.path.join(out_dir, filename))
+
+    for slug, hashes, _, _, _ in results:
+        out_state[slug] = hashes
+    write_atomic(state_path, json.dumps(state, ensure_ascii=False, indent=2))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Експорт статичних сайтів підприємств")
+    parser.add_argument("--out", default=".", help="каталог для згенерованих сайтів")
+    parser.add_argument("--tenants", nargs="*", help="slug підприємств (за замовчуванням усі)")
+    parser.add_argument("--jobs", type=int, default=None, help="кількість процесів")
+    parser.add_argument("--force", action="store_true", help="перебудувати всі сторінки")
+    parser.add_argument("--fingerprint", action="store_true",
+                        help="копії файлів з хешем в імені, .gz/.br та asset-manifest.json (потрібен окремий --out)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        if args.fingerprint:
+            check_out_dir(args.out)
+        results = export(args.out, args.tenants, args.jobs, args.force)
+    except ValueError as e:
+        print(f"⚠️  {e}", file=sys.stderr)
+        return 1
+
+    width = max([len("Сайт")] + [len(slug) for slug, *_ in results])
+    print(f"{'Сайт':<{width}}  {'Зібрано':>7}  {'Пропущено':>9}  {'Час':>8}")
+    for slug, _, built, skipped, seconds in results:
+        print(f"{slug:<{width}}  {built:>7}  {skipped:>9}  {seconds * 1000:>6.0f}ms")
+    if args.fingerprint:
+        print_report(fingerprint(args.out))
+    print(f"Разом: {time.perf_counter() - started:.2f} с")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
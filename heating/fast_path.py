@@ -0,0 +1,116 @@
+"""Швидка віддача готового HTML статичних сторінок без сесії Streamlit
+
+Звичайний GET / (з ?tenant= та ?page=contacts) отримує Головну або Контакти,
+згенеровані тими ж шаблонами, що й статичний експорт, без websocket-сесії та
+перезапуску скрипта. Готовий HTML кешується за ключем (підприємство, сторінка,
+хеш конфігурації, версія стилів). Документи й Фотогалерея потребують живого
+застосунку (вікна PDF, таблиця тарифів, пошук, гортання галереї), тож вони, як
+і запити з ?live=1, іншими параметрами чи невідомими сторінками (наприклад,
+?page=admin), отримують звичайний застосунок Streamlit.
+"""
+import os
+import threading
+from urllib.parse import urlencode
+
+import tornado.web
+from streamlit import file_util
+
+from heating import metrics
+from heating.file_server import file_url
+from heating.server import add_route, url_path
+from heating.static_site import PAGE_URLS, PAGES, render_page
+from heating.tenants import get_registry
+
+# Параметри, з якими сторінку ще можна віддати готовою
+FAST_PATH_PARAMS = {"tenant", "page"}
+STYLESHEET_PATH = "style.css"
+# Сторінки, що залежать лише від конфігурації; решта відкривається в застосунку
+FAST_PATH_PAGES = ("Головна", "Контакти")
+PAGE_SLUGS = {PAGE_URLS[page].lstrip("/") or "home": page for page in FAST_PATH_PAGES}
+
+_pages = {}
+_lock = threading.Lock()
+_index_html = None
+
+
+class LiveUrls:
+    """Посилання для сторінок з сервера: розділи - на адреси застосунку, стилі - через /_files"""
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    def page(self, slug, page):
+        params = {"tenant": slug}
+        if page != PAGES[0]:
+            params["page"] = PAGE_URLS[page].lstrip("/")
+        return f"{url_path()}?{urlencode(params)}"
+
+    def stylesheet(self, page):
+        return file_url(STYLESHEET_PATH)
+
+
+def _page_key(config):
+    """Ключ готової сторінки: хеш конфігурації та версія стилів"""
+    try:
+        stat = os.stat(STYLESHEET_PATH)
+        return (config.hash, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (config.hash, None, None)
+
+
+def page_html(tenant, page):
+    """Готовий HTML сторінки; генерується лише при зміні ключа"""
+    config = tenant.config
+    key = _page_key(config)
+    with _lock:
+        cached = _pages.get((tenant.slug, page))
+    if cached is not None and cached[0] == key:
+        metrics.increment("fast_path_hits")
+        return cached[1]
+
+    metrics.increment("fast_path_misses")
+    with metrics.span("fast_path_render"):
+        html = render_page(config, tenant.slug, page, LiveUrls(tenant)).encode("utf-8")
+    with _lock:
+        _pages[(tenant.slug, page)] = (key, html)
+    return html
+
+
+def streamlit_index():
+    """index.html застосунку Streamlit (для живої сесії)"""
+    global _index_html
+    if _index_html is None:
+        with open(os.path.join(file_util.get_static_dir(), "index.html"), "rb") as f:
+            _index_html = f.read()
+    return _index_html
+
+
+class FastPathHandler(tornado.web.RequestHandler):
+    """GET / : готова сторінка або застосунок Streamlit"""
+
+    def _resolve(self):
+        if set(self.request.arguments) - FAST_PATH_PARAMS:
+            return None, None
+        page = PAGE_SLUGS.get(self.get_query_argument("page", "home"))
+        if page is None:
+            return None, None
+        tenant = get_registry().resolve(self.get_query_argument("tenant", None), self.request.host)
+        if not tenant.config.settings.fast_path:
+            return None, None
+        return tenant, page
+
+    def get(self):
+        tenant, page = self._resolve()
+        self.set_header("Cache-Control", "no-cache")
+        self.set_header("Content-Type", "text/html; charset=utf-8")
+        if tenant is None:
+            self.write(streamlit_index())
+            return
+        metrics.set_labels(tenant=tenant.slug, page=page)
+        self.write(page_html(tenant, page))
+
+    def head(self):
+        self.get()
+
+
+add_route(r"(?:index\.html)?", FastPathHandler)
@@ -0,0 +1,101 @@
+"""Віддача документів через HTTP з підтримкою Range, ETag та кешування браузером"""
+import os
+import threading
+from urllib.parse import quote
+
+import tornado.web
+
+from heating.blobs import content_hash, store
+from heating.doc_cache import get_document_cache
+from heating.server import add_route, url_path
+from heating.tenants import get_registry
+
+FILES_ENDPOINT = "_files"
+CHUNK_SIZE = 64 * 1024
+
+_files = {}
+_lock = threading.Lock()
+
+
+def _settings(tenant):
+    """Налаштування підприємства; для файлів, спільних для кількох, - підприємства за замовчуванням"""
+    registry = get_registry()
+    owner = registry.get(tenant) if tenant else None
+    return (owner or registry.resolve()).config.settings
+
+
+def _version(stat):
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+class FileHandler(tornado.web.StaticFileHandler):
+    """Віддає лише файли, зареєстровані через file_url()"""
+
+    @classmethod
+    def get_absolute_path(cls, root, path):
+        file_id = path.split("/", 1)[0]
+        with _lock:
+            return _files.get(file_id, ("", None))[0]
+
+    def validate_absolute_path(self, root, absolute_path):
+        if not absolute_path or not os.path.isfile(absolute_path):
+            raise tornado.web.HTTPError(404)
+        with _lock:
+            self.tenant = _files.get(self.path.split("/", 1)[0], ("", None))[1]
+        return absolute_path
+
+    def compute_etag(self):
+        return f'"{content_hash(self.absolute_path)}"'
+
+    def get_cache_time(self, path, modified, mime_type):
+        # Версія файлу входить в URL, тож відповідь можна кешувати назавжди
+        return self.CACHE_MAX_AGE if self.get_query_argument("v", None) else 0
+
+    def set_extra_headers(self, path):
+        if self.get_query_argument("v", None):
+            self.set_header("Cache-Control", f"public, max-age={self.CACHE_MAX_AGE}, immutable")
+        else:
+            self.set_header("Cache-Control", "no-cache")
+        if self.get_query_argument("download", None):
+            self.set_header("Content-Disposition", content_disposition(os.path.basename(path)))
+
+    def get_content(self, abspath, start=None, end=None):
+        # Невеликі файли для перегляду віддаються з кешу документів свого підприємства;
+        # завантаження читаються з диска частинами, щоб не витісняти з кешу переглядувані файли
+        cache = get_document_cache(_settings(self.tenant).document_cache_mb, tenant=self.tenant)
+        if not self.get_query_argument("download", None) and os.path.getsize(abspath) <= cache.budget_bytes:
+            data = cache.get(abspath)
+            stop = len(data) if end is None else end
+            for offset in range(start or 0, stop, CHUNK_SIZE):
+                yield data[offset:min(offset + CHUNK_SIZE, stop)]
+            return
+        yield from super().get_content(abspath, start, end)
+
+
+def content_disposition(filename):
+    """Заголовок для збереження файлу з українською назвою (RFC 6266)"""
+    fallback = filename.encode("ascii", "replace").decode("ascii").replace("?", "_").replace('"', "_")
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+
+def file_url(path, tenant=None, download=False):
+    """URL файлу на сервері; версія в параметрі v змінюється разом з файлом
+
+    Файл віддається зі спільного сховища heating.blobs: однаковий вміст у різних
+    підприємств має одну адресу й один запис у кеші документів (спільному,
+    якщо файл зареєстрували кілька підприємств). З download=True браузер
+    зберігає файл замість того, щоб відкрити його.
+    """
+    abspath = os.path.abspath(store(path))
+    file_id = content_hash(abspath)[:16]
+    with _lock:
+        known = _files.get(file_id)
+        owner = tenant if known is None or known[1] == tenant else None
+        _files[file_id] = (abspath, owner)
+    version = _version(os.stat(abspath))
+    name = quote(os.path.basename(path))
+    url = f"{url_path(FILES_ENDPOINT, file_id, name)}?v={version}"
+    return f"{url}&download=1" if download else url
+
+
+add_route(FILES_ENDPOINT + r"/(.*)", FileHandler, {"path": ""})
@@ -0,0 +1,42 @@
+"""Кеш готових фрагментів сторінки, що залежать лише від конфігурації
+
+Заголовок, блок контактів, швидкі контакти в боковій панелі та футер
+будуються один раз на (підприємство, фрагмент, хеш конфігурації). Зміна
+конфігу дає новий хеш, і фрагмент перебудовується при наступному
+зверненні; старий запис при цьому замінюється.
+"""
+import threading
+
+_fragments = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def fragment(tenant, fragment_id, config, build):
+    """Текст фрагмента з кешу; build(config) викликається лише для нової конфігурації"""
+    key = (tenant, fragment_id)
+    with _lock:
+        cached = _fragments.get(key)
+        counts = _stats.setdefault(fragment_id, [0, 0])
+        if cached is not None and cached[0] == config.hash:
+            counts[0] += 1
+            return cached[1]
+        counts[1] += 1
+
+    value = build(config)
+    with _lock:
+        _fragments[key] = (config.hash, value)
+    return value
+
+
+def stats():
+    """Влучання та промахи кешу для кожного фрагмента"""
+    with _lock:
+        return {
+            fragment_id: {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            }
+            for fragment_id, (hits, misses) in _stats.items()
+        }
@@ -0,0 +1,255 @@
+"""Маніфест фотогалереї: розміри, орієнтація та крихітні заглушки фото
+
+Маніфест будується один раз, зберігається на диску й оновлюється лише для
+нових або змінених файлів. Зміни папки помічає watchdog (якщо встановлений),
+інакше - перевірка mtime папки. Сторінка галереї будується лише з маніфесту,
+а зменшені копії фото створюються окремим маршрутом, коли браузер їх запитує.
+"""
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass
+from html import escape
+
+import tornado.ioloop
+import tornado.web
+
+from heating.atomic import write_json
+from heating.blobs import content_hash
+from heating.images import VARIANTS, derivative
+from heating.server import add_route, url_path
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+THUMBS_ENDPOINT = "_thumbs"
+MANIFEST_VERSION = 1
+# Ширина заглушки в пікселях; браузер розтягує її з розмиттям
+PLACEHOLDER_WIDTH = 16
+THUMB_NAME_RE = re.compile(r"([0-9a-f]{16})-(\d+)\.(webp|jpeg)")
+
+_manifests = {}
+_sources = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PhotoInfo:
+    filename: str
+    hash: str
+    width: int
+    height: int
+    orientation: int
+    placeholder: str
+    size: int
+    mtime_ns: int
+
+
+def _placeholder(image):
+    small = image.copy()
+    small.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH))
+    if small.mode not in ("RGB", "L"):
+        small = small.convert("RGB")
+    buffer = io.BytesIO()
+    small.save(buffer, "WEBP", quality=30)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def photo_info(path):
+    """Опис одного фото; розміри - з урахуванням орієнтації з EXIF"""
+    # Pillow імпортується лише тут: процес приймає запити, не чекаючи на нього
+    from PIL import Image, ImageOps
+
+    stat = os.stat(path)
+    with Image.open(path) as image:
+        orientation = image.getexif().get(0x0112, 1)
+        image = ImageOps.exif_transpose(image)
+        width, height = image.size
+        placeholder = _placeholder(image)
+    return PhotoInfo(
+        filename=os.path.basename(path),
+        hash=content_hash(path)[:16],
+        width=width,
+        height=height,
+        orientation=orientation,
+        placeholder=placeholder,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+    )
+
+
+if Observer is not None:
+    class _DirtyFlag(FileSystemEventHandler):
+        def __init__(self, manifest):
+            self.manifest = manifest
+
+        # Відкриття файлів під час читання теж дає події, тому реагуємо лише на зміни
+        def on_created(self, event):
+            self.manifest.dirty = True
+
+        on_deleted = on_modified = on_moved = on_created
+
+
+class GalleryManifest:
+    """Маніфест однієї папки з фото"""
+
+    def __init__(self, folder, supported_formats, cache_dir):
+        self.folder = folder
+        self.supported_formats = tuple(supported_formats)
+        self.cache_dir = cache_dir
+        digest = hashlib.sha1(os.path.abspath(folder).encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(cache_dir, f"manifest-{digest}.json")
+        self.dirty = True
+        self.rebuilds = 0
+        self._folder_mtime = None
+        self._photos = self._load()
+        self._lock = threading.Lock()
+        self._observer = None
+        if Observer is not None and os.path.isdir(folder):
+            try:
+                self._observer = Observer()
+                self._observer.schedule(_DirtyFlag(self), folder, recursive=False)
+                self._observer.daemon = True
+                self._observer.start()
+            except OSError:
+                # Вичерпано ліміт inotify - лишається перевірка mtime
+                self._observer = None
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return {item["filename"]: PhotoInfo(**item) for item in data["photos"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save(self, photos):
+        write_json(self.path, {"version": MANIFEST_VERSION, "photos": [asdict(p) for p in photos.values()]})
+
+    def _changed(self):
+        if self._observer is not None:
+            return self.dirty
+        try:
+            mtime = os.stat(self.folder).st_mtime_ns
+        except OSError:
+            mtime = None
+        return self.dirty or mtime != self._folder_mtime
+
+    def _rebuild(self):
+        """Оновлення маніфесту: відкриваються лише нові та змінені файли"""
+        self.dirty = False
+        try:
+            self._folder_mtime = os.stat(self.folder).st_mtime_ns
+            names = sorted(os.listdir(self.folder))
+        except OSError:
+            self._folder_mtime = None
+            names = []
+
+        photos = {}
+        for name in names:
+            if not name.lower().endswith(self.supported_formats):
+                continue
+            path = os.path.join(self.folder, name)
+            try:
+                stat = os.stat(path)
+                known = self._photos.get(name)
+                if known and known.size == stat.st_size and known.mtime_ns == stat.st_mtime_ns:
+                    photos[name] = known
+                else:
+                    photos[name] = photo_info(path)
+            except (OSError, ValueError):
+                # Файл ще записується або пошкоджений - спробуємо наступного разу
+                continue
+
+        if photos != self._photos or not os.path.exists(self.path):
+            self._save(photos)
+        self._photos = photos
+        self.rebuilds += 1
+        with _lock:
+            for info in photos.values():
+                _sources[info.hash] = (os.path.join(self.folder, info.filename), self.cache_dir)
+
+    def photos(self):
+        """Фото папки (ім'я файлу -> PhotoInfo)"""
+        if self._changed():
+            with self._lock:
+                if self._changed():
+                    self._rebuild()
+        return self._photos
+
+
+def get_manifest(folder, supported_formats, cache_dir):
+    """Спільний для всіх сесій маніфест папки"""
+    key = (os.path.abspath(folder), tuple(supported_formats), os.path.abspath(cache_dir))
+    with _lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = _manifests[key] = GalleryManifest(folder, supported_formats, cache_dir)
+        return manifest
+
+
+def thumb_url(info, variant, fmt):
+    """URL зменшеної копії; хеш вмісту в імені, тож її можна кешувати назавжди"""
+    return url_path(THUMBS_ENDPOINT, f"{info.hash}-{VARIANTS[variant]}.{fmt}")
+
+
+def picture_html(info, alt="", sizes="100vw", variants=tuple(VARIANTS), lazy=True):
+    """<picture> з розмірами та заглушкою; справжні фото браузер довантажує сам"""
+    webp = ", ".join(f"{thumb_url(info, v, 'webp')} {VARIANTS[v]}w" for v in variants)
+    jpeg = ", ".join(f"{thumb_url(info, v, 'jpeg')} {VARIANTS[v]}w" for v in variants)
+    loading = ' loading="lazy" decoding="async"' if lazy else ""
+    return (
+        f'<picture>'
+        f'<source type="image/webp" srcset="{webp}" sizes="{sizes}">'
+        f'<img src="{thumb_url(info, variants[0], "jpeg")}" srcset="{jpeg}" sizes="{sizes}"'
+        f' width="{info.width}" height="{info.height}" alt="{escape(alt)}"{loading}'
+        f' style="width: 100%; height: auto; background: url({info.placeholder}) center / cover;">'
+        f'</picture>'
+    )
+
+
+class ThumbnailHandler(tornado.web.StaticFileHandler):
+    """GET /_thumbs/<хеш>-<ширина>.<формат>; копія створюється при першому запиті"""
+
+    async def get(self, path, include_body=True):
+        match = THUMB_NAME_RE.fullmatch(path)
+        widths = {width: variant for variant, width in VARIANTS.items()}
+        with _lock:
+            source = _sources.get(match.group(1)) if match else None
+        if source is None or int(match.group(2)) not in widths:
+            raise tornado.web.HTTPError(404)
+        source_path, cache_dir = source
+        # Обробка фото - у пулі потоків, щоб не зупиняти сервер для інших відвідувачів
+        await tornado.ioloop.IOLoop.current().run_in_executor(
+            None, derivative, source_path, widths[int(match.group(2))], match.group(3), cache_dir
+        )
+        await super().get(path, include_body)
+
+    @classmethod
+    def get_absolute_path(cls, root, path):
+        with _lock:
+            source = _sources.get(path.split("-", 1)[0])
+        return os.path.join(source[1], path) if source else ""
+
+    def validate_absolute_path(self, root, absolute_path):
+        if not absolute_path or not os.path.isfile(absolute_path):
+            raise tornado.web.HTTPError(404)
+        return absolute_path
+
+    def get_cache_time(self, path, modified, mime_type):
+        return self.CACHE_MAX_AGE
+
+    def set_extra_headers(self, path):
+        self.set_header("Cache-Control", f"public, max-age={self.CACHE_MAX_AGE}, immutable")
+
+
+add_route(THUMBS_ENDPOINT + r"/(.*)", ThumbnailHandler, {"path": ""})
@@ -0,0 +1,71 @@
+"""Зменшені копії фотографій для галереї (WebP з JPEG-запасним варіантом)"""
+import os
+import threading
+
+from heating.atomic import atomic_path
+from heating.blobs import content_hash
+
+# Ширини похідних зображень у пікселях
+VARIANTS = {
+    "thumb": 320,
+    "mobile": 768,
+    "desktop": 1600,
+}
+
+FORMATS = {
+    "webp": {"format": "WEBP", "mime": "image/webp", "options": {"quality": 80, "method": 4}},
+    "jpeg": {"format": "JPEG", "mime": "image/jpeg", "options": {"quality": 82, "optimize": True, "progressive": True}},
+}
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "images")
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(target):
+    with _locks_guard:
+        return _locks.setdefault(target, threading.Lock())
+
+
+def _render(source_path, width, fmt, target):
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as image:
+        # Враховуємо орієнтацію з EXIF, інакше фото з телефонів лежать на боці
+        image = ImageOps.exif_transpose(image)
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        spec = FORMATS[fmt]
+        with atomic_path(target) as tmp_path:
+            image.save(tmp_path, spec["format"], **spec["options"])
+
+
+def derivative(source_path, variant, fmt="webp", cache_dir=DEFAULT_CACHE_DIR):
+    """Шлях до похідного зображення; створює його при першому зверненні
+
+    Ім'я файлу містить хеш вмісту оригіналу, тож зміна фото дає новий файл.
+    """
+    width = VARIANTS[variant]
+    digest = content_hash(source_path)[:16]
+    target = os.path.join(cache_dir, f"{digest}-{width}.{fmt}")
+    if os.path.exists(target):
+        return target
+
+    with _lock_for(target):
+        if not os.path.exists(target):
+            os.makedirs(cache_dir, exist_ok=True)
+            _render(source_path, width, fmt, target)
+    return target
+
+
+def generate_all(source_path, cache_dir=DEFAULT_CACHE_DIR):
+    """Створення всіх похідних зображень для одного фото"""
+    return {
+        variant: {fmt: derivative(source_path, variant, fmt, cache_dir) for fmt in FORMATS}
+        for variant in VARIANTS
+    }
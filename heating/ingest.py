@@ -0,0 +1,122 @@
+"""Прийом завантажених адміністратором файлів
+
+Файл записується частинами у тимчасовий файл у цільовій папці й атомарно
+перейменовується, тож відвідувачі ніколи не бачать половину документа.
+Похідні файли (оптимізований PDF, пошуковий індекс, зменшені фото) готуються
+у фоновому пулі потоків, а відповідні кеші скидаються.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from heating.atomic import atomic_write
+from heating.blobs import current_blob
+from heating.doc_cache import invalidate_everywhere
+from heating.images import generate_all
+from heating.optimize_pdfs import optimize_file, optimized_path
+from heating.search import get_index
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+MAX_WORKERS = 2
+# Скільки останніх завдань показувати в адмін-панелі
+JOB_HISTORY = 50
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="ingest")
+_jobs = deque(maxlen=JOB_HISTORY)
+_jobs_lock = threading.Lock()
+
+
+class Job:
+    """Фонове завдання обробки одного файлу"""
+
+    def __init__(self, tenant, path, kind):
+        self.tenant = tenant
+        self.path = path
+        self.kind = kind
+        self.status = "в черзі"
+        self.error = None
+        self.seconds = 0.0
+
+
+def safe_filename(name):
+    """Ім'я файлу без шляху (захист від ../ у назві з браузера)"""
+    name = os.path.basename(name.replace("\\", "/")).strip()
+    if not name or name.startswith("."):
+        raise ValueError(f"Некоректне ім'я файлу: {name!r}")
+    return name
+
+
+def save_upload(uploaded_file, folder, filename=None):
+    """Запис завантаженого файлу частинами з атомарною заміною; повертає шлях"""
+    target = os.path.join(folder, safe_filename(filename or uploaded_file.name))
+    uploaded_file.seek(0)
+    with atomic_write(target, "wb", fsync=True) as f:
+        for chunk in iter(lambda: uploaded_file.read(CHUNK_SIZE), b""):
+            f.write(chunk)
+    return target
+
+
+def _document_blobs(path):
+    """Blob-и, з яких зараз віддаються документ і його оптимізована копія"""
+    return [current_blob(version) for version in (path, optimized_path(path)) if os.path.isfile(version)]
+
+
+def _process_document(tenant, path):
+    optimize_file(path)
+    # Текст нової версії потрапляє в пошуковий індекс одразу, а не з першим запитом
+    get_index(tenant).refresh()
+
+
+def _process_photo(tenant, path):
+    generate_all(path, tenant.cache_dir("images"))
+
+
+PROCESSORS = {
+    "document": _process_document,
+    "photo": _process_photo,
+}
+
+
+def _run(job, tenant):
+    job.status = "обробка"
+    started = time.perf_counter()
+    try:
+        PROCESSORS[job.kind](tenant, job.path)
+        job.status = "готово"
+    except Exception as e:
+        job.status = "помилка"
+        job.error = str(e)
+        logger.warning("Не вдалося обробити %s: %s", job.path, e)
+    finally:
+        job.seconds = time.perf_counter() - started
+
+
+def submit(tenant, path, kind):
+    """Постановка файлу у фонову обробку; сторінки інших відвідувачів не чекають"""
+    job = Job(tenant.slug, path, kind)
+    with _jobs_lock:
+        _jobs.appendleft(job)
+    _executor.submit(_run, job, tenant)
+    return job
+
+
+def ingest(tenant, uploaded_file, folder, kind, filename=None):
+    """Збереження завантаження та запуск обробки похідних файлів"""
+    # Кеш документів зберігає вміст за шляхом blob, тож стару версію шукаємо за її хешем
+    target = os.path.join(folder, safe_filename(filename or uploaded_file.name))
+    previous = _document_blobs(target) if kind == "document" else []
+    path = save_upload(uploaded_file, folder, filename)
+    for blob in previous:
+        invalidate_everywhere(blob)
+    return submit(tenant, path, kind)
+
+
+def recent_jobs(tenant_slug=None):
+    """Останні завдання (для адмін-панелі)"""
+    with _jobs_lock:
+        return [job for job in _jobs if tenant_slug is None or job.tenant == tenant_slug]
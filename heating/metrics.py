@@ -0,0 +1,176 @@
+"""Час етапів кожного перезапуску та ендпоінт /_metrics у форматі Prometheus"""
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+import tornado.web
+
+from heating.blobs import stats as blob_stats
+from heating.doc_cache import all_document_caches
+from heating.fragments import stats as fragment_stats
+from heating.server import add_route
+from heating.tenants import get_registry
+
+METRICS_ENDPOINT = "_metrics"
+# Межі кошиків гістограм у секундах
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_enabled = True
+_trace_path = ""
+_trace_file = None
+_histograms = {}
+_counters = {}
+_lock = threading.Lock()
+_context = threading.local()
+
+
+class Histogram:
+    """Кумулятивна гістограма тривалостей одного етапу"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+def configure(enabled=True, trace_path=""):
+    """Увімкнення збору та (необов'язкового) журналу етапів у JSONL"""
+    global _enabled, _trace_path, _trace_file
+    with _lock:
+        _enabled = enabled
+        if trace_path != _trace_path:
+            if _trace_file is not None:
+                _trace_file.close()
+            _trace_file = open(trace_path, "a", encoding="utf-8", buffering=1) if trace_path else None
+            _trace_path = trace_path
+
+
+def set_labels(**labels):
+    """Мітки (сторінка, підприємство) для етапів поточного перезапуску"""
+    _context.labels = {**getattr(_context, "labels", {}), **labels}
+
+
+def observe(stage, seconds):
+    """Запис тривалості етапу з мітками поточного потоку"""
+    if not _enabled:
+        return
+    labels = getattr(_context, "labels", {})
+    key = (stage, labels.get("tenant", ""), labels.get("page", ""))
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = Histogram()
+        histogram.observe(seconds)
+        if _trace_file is not None:
+            _trace_file.write(json.dumps(
+                {"ts": time.time(), "stage": stage, "seconds": round(seconds, 6), **labels},
+                ensure_ascii=False
+            ) + "\n")
+
+
+def increment(name, value=1):
+    """Збільшення лічильника з міткою підприємства поточного потоку"""
+    if not _enabled:
+        return
+    key = (name, getattr(_context, "labels", {}).get("tenant", ""))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+@contextmanager
+def span(stage):
+    """Вимірювання тривалості блоку коду"""
+    if not _enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - started)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_prometheus():
+    """Усі метрики в текстовому форматі Prometheus"""
+    lines = [
+        "# HELP heating_stage_seconds Тривалість етапів перезапуску застосунку",
+        "# TYPE heating_stage_seconds histogram",
+    ]
+    with _lock:
+        snapshot = {key: (list(h.counts), h.total, h.count) for key, h in _histograms.items()}
+        counters = dict(_counters)
+    for (stage, tenant, page), (counts, total, count) in sorted(snapshot.items()):
+        cumulative = 0
+        for bound, bucket_count in zip(BUCKETS + ("+Inf",), counts):
+            cumulative += bucket_count
+            le = bound if bound == "+Inf" else f"{bound:g}"
+            lines.append(f"heating_stage_seconds_bucket{_labels(stage=stage, tenant=tenant, page=page, le=le)} {cumulative}")
+        lines.append(f"heating_stage_seconds_sum{_labels(stage=stage, tenant=tenant, page=page)} {total:.6f}")
+        lines.append(f"heating_stage_seconds_count{_labels(stage=stage, tenant=tenant, page=page)} {count}")
+
+    for name in sorted({name for name, _ in counters}):
+        lines.append(f"# TYPE heating_{name}_total counter")
+        for (counter_name, tenant), value in sorted(counters.items()):
+            if counter_name == name:
+                lines.append(f"heating_{name}_total{_labels(tenant=tenant)} {value}")
+
+    cache_metrics = (
+        ("hits", "counter"), ("misses", "counter"), ("evictions", "counter"),
+        ("bytes_read", "counter"), ("bytes_cached", "gauge"), ("entries", "gauge"),
+    )
+    caches = all_document_caches()
+    for name, kind in cache_metrics:
+        metric = f"heating_document_cache_{name}" + ("_total" if kind == "counter" else "")
+        lines.append(f"# TYPE {metric} {kind}")
+        for tenant, cache in sorted(caches.items(), key=lambda item: str(item[0])):
+            lines.append(f"{metric}{_labels(tenant=tenant or '')} {cache.stats()[name]}")
+
+    for name, value in blob_stats().items():
+        lines.append(f"# TYPE heating_{name} gauge")
+        lines.append(f"heating_{name} {value}")
+
+    fragments = fragment_stats()
+    for name, kind in (("hits", "counter"), ("misses", "counter"), ("hit_ratio", "gauge")):
+        metric = f"heating_fragment_{name}" + ("_total" if kind == "counter" else "")
+        lines.append(f"# TYPE {metric} {kind}")
+        for fragment_id, values in sorted(fragments.items()):
+            lines.append(f"{metric}{_labels(fragment=fragment_id)} {values[name]:g}")
+
+    lines.append("# TYPE heating_config_reloads_total counter")
+    config_stats = get_registry().stats()
+    for slug, stats in sorted(config_stats.items()):
+        lines.append(f"heating_config_reloads_total{_labels(tenant=slug)} {stats['reload_count']}")
+    lines.append("# TYPE heating_config_errors_total counter")
+    for slug, stats in sorted(config_stats.items()):
+        lines.append(f"heating_config_errors_total{_labels(tenant=slug)} {stats['error_count']}")
+    lines.append("# TYPE heating_config_parse_seconds gauge")
+    for slug, stats in sorted(config_stats.items()):
+        lines.append(f"heating_config_parse_seconds{_labels(tenant=slug)} {stats['last_parse_seconds']:.6f}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    """GET /_metrics"""
+
+    def get(self):
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.set_header("Cache-Control", "no-store")
+        self.write(render_prometheus())
+
+
+add_route(METRICS_ENDPOINT, MetricsHandler)
@@ -0,0 +1,183 @@
+"""Стиснення PDF у папках docs з друком звіту про розміри
+
+Запуск: python -m heating.optimize_pdfs [папки...] [--dpi 150] [--quality 75]
+
+Оптимізовані копії записуються в підпапку optimized/ поруч з оригіналом,
+лише якщо вони менші. Сайт автоматично віддає перевагу таким копіям.
+"""
+import argparse
+import io
+import os
+import sys
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+from heating.atomic import write_atomic
+from heating.sizes import format_size
+
+OPTIMIZED_FOLDER = "optimized"
+DOCS_FOLDERS = ("docs", "documents")
+DEFAULT_DPI = 150
+DEFAULT_QUALITY = 75
+# Копії, що економлять менше цієї частки, не зберігаються
+MIN_SAVING = 0.02
+
+
+def optimized_path(path):
+    """Шлях, за яким лежить (або ляже) оптимізована копія документа"""
+    folder, filename = os.path.split(path)
+    return os.path.join(folder, OPTIMIZED_FOLDER, filename)
+
+
+def preferred_path(path):
+    """Оптимізована копія, якщо вона є і не старша за оригінал; інакше сам документ"""
+    candidate = optimized_path(path)
+    try:
+        if os.path.getmtime(candidate) >= os.path.getmtime(path):
+            return candidate
+    except OSError:
+        pass
+    return path
+
+
+def _downsample_images(writer, dpi, quality):
+    """Зменшення сканів, роздільна здатність яких перевищує dpi на сторінці"""
+    replaced = 0
+    for page in writer.pages:
+        page_inches = max(float(page.mediabox.width), float(page.mediabox.height)) / 72
+        max_pixels = int(page_inches * dpi)
+        for image_file in page.images:
+            try:
+                image = image_file.image
+                if max(image.size) <= max_pixels * 1.05:
+                    continue
+                scale = max_pixels / max(image.size)
+                resized = image.resize(
+                    (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+                )
+                if resized.mode not in ("RGB", "L"):
+                    resized = resized.convert("RGB")
+                image_file.replace(resized, quality=quality)
+                replaced += 1
+            except Exception:
+                # Вбудовані зображення та рідкісні фільтри залишаємо як є
+                continue
+    return replaced
+
+
+def _remap_references(obj, remap, writer):
+    if isinstance(obj, DictionaryObject):
+        items = obj.items()
+    elif isinstance(obj, ArrayObject):
+        items = enumerate(obj)
+    else:
+        return
+    for key, value in list(items):
+        if isinstance(value, IndirectObject) and value.idnum in remap:
+            obj[key] = IndirectObject(remap[value.idnum], 0, writer)
+        elif isinstance(value, (DictionaryObject, ArrayObject)):
+            _remap_references(value, remap, writer)
+
+
+def _deduplicate_streams(writer):
+    """Однакові потоки (шрифти, зображення) замінюються посиланням на один об'єкт"""
+    canonical = {}
+    remap = {}
+    for index, obj in enumerate(writer._objects):
+        if isinstance(obj, StreamObject):
+            digest = obj.hash_value()
+            if digest in canonical:
+                remap[index + 1] = canonical[digest]
+            else:
+                canonical[digest] = index + 1
+    if remap:
+        for obj in writer._objects:
+            if isinstance(obj, (DictionaryObject, ArrayObject)):
+                _remap_references(obj, remap, writer)
+    return len(remap)
+
+
+def optimize_pdf(source, dpi=DEFAULT_DPI, quality=DEFAULT_QUALITY):
+    """Повертає байти оптимізованого PDF"""
+    writer = PdfWriter(clone_from=PdfReader(source))
+    _downsample_images(writer, dpi, quality)
+    for page in writer.pages:
+        page.compress_content_streams()
+    _deduplicate_streams(writer)
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+
+    # Повторне клонування залишає лише досяжні об'єкти, тож дублікати зникають
+    buffer.seek(0)
+    compact = PdfWriter(clone_from=PdfReader(buffer))
+    output = io.BytesIO()
+    compact.write(output)
+    return output.getvalue()
+
+
+def find_documents(roots):
+    """Усі PDF у папках docs/documents під заданими каталогами"""
+    for root in roots:
+        for folder, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(
+                d for d in dirnames if not d.startswith(".") and d != OPTIMIZED_FOLDER
+            )
+            if os.path.basename(folder) not in DOCS_FOLDERS:
+                continue
+            for filename in sorted(filenames):
+                if filename.lower().endswith(".pdf"):
+                    yield os.path.join(folder, filename)
+
+
+def optimize_file(path, dpi=DEFAULT_DPI, quality=DEFAULT_QUALITY):
+    """Оптимізація одного документа; повертає (розмір до, розмір після)"""
+    before = os.path.getsize(path)
+    data = optimize_pdf(path, dpi, quality)
+    target = optimized_path(path)
+    if len(data) > before * (1 - MIN_SAVING):
+        # Копія майже не менша за оригінал - не зберігаємо, а застарілу видаляємо
+        if os.path.exists(target):
+            os.remove(target)
+        return before, before
+
+    write_atomic(target, data)
+    return before, len(data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Стиснення PDF документів сайту")
+    parser.add_argument("roots", nargs="*", default=["."], help="каталоги для пошуку папок docs")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="цільова роздільна здатність сканів")
+    parser.add_argument("--quality", type=int, default=DEFAULT_QUALITY, help="якість JPEG для зменшених сканів")
+    args = parser.parse_args(argv)
+
+    rows = []
+    for path in find_documents(args.roots):
+        try:
+            before, after = optimize_file(path, args.dpi, args.quality)
+        except Exception as e:
+            print(f"⚠️  {path}: {e}", file=sys.stderr)
+            continue
+        rows.append((path, before, after))
+
+    if not rows:
+        print("PDF документів не знайдено.")
+        return 0
+
+    width = max(len(path) for path, _, _ in rows)
+    print(f"{'Документ':<{width}}  {'До':>10}  {'Після':>10}  {'Економія':>8}")
+    for path, before, after in rows:
+        saving = 100 * (before - after) / before if before else 0
+        print(f"{path:<{width}}  {format_size(before):>10}  {format_size(after):>10}  {saving:>7.1f}%")
+
+    total_before = sum(before for _, before, _ in rows)
+    total_after = sum(after for _, _, after in rows)
+    saving = 100 * (total_before - total_after) / total_before if total_before else 0
+    print(f"{'Разом':<{width}}  {format_size(total_before):>10}  {format_size(total_after):>10}  {saving:>7.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
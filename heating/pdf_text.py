@@ -0,0 +1,43 @@
+"""Текст сторінок PDF, збережений на диску за хешем вмісту документа"""
+import json
+import os
+
+from pypdf import PdfReader
+
+from heating.atomic import write_json
+from heating.blobs import content_hash
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "text")
+
+
+def text_path(path, cache_dir=DEFAULT_CACHE_DIR):
+    """Файл з текстом сторінок для поточної версії документа"""
+    return os.path.join(cache_dir, f"{content_hash(path)[:16]}.json")
+
+
+def cached_text(digest, cache_dir=DEFAULT_CACHE_DIR):
+    """Текст сторінок за відомим хешем (перші 16 символів) без читання PDF; None, якщо його немає"""
+    try:
+        with open(os.path.join(cache_dir, f"{digest}.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def extract_text(path, cache_dir=DEFAULT_CACHE_DIR):
+    """Список текстів сторінок; PDF розбирається лише для нової версії файлу"""
+    target = text_path(path, cache_dir)
+    if os.path.exists(target):
+        with open(target, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    pages = []
+    for page in PdfReader(path).pages:
+        try:
+            pages.append(page.extract_text() or "")
+        except Exception:
+            # Скан без текстового шару або пошкоджена сторінка
+            pages.append("")
+
+    write_json(target, pages)
+    return pages
@@ -0,0 +1,60 @@
+"""Перегляд великих PDF частинами: окремий файл на кожне вікно сторінок"""
+import os
+import threading
+
+from pypdf import PdfReader, PdfWriter
+
+from heating.atomic import atomic_write
+from heating.blobs import content_hash
+
+DEFAULT_WINDOW_PAGES = 5
+DEFAULT_CACHE_DIR = os.path.join(".cache", "pdf_windows")
+
+_page_counts = {}
+_locks = {}
+_lock = threading.Lock()
+
+
+def page_count(path):
+    """Кількість сторінок; PDF розбирається один раз на версію файлу"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        count = _page_counts.get(key)
+    if count is None:
+        count = len(PdfReader(path).pages)
+        with _lock:
+            _page_counts[key] = count
+    return count
+
+
+def window_bounds(path, window, window_pages=DEFAULT_WINDOW_PAGES):
+    """Межі вікна (перша сторінка включно, остання не включно) з нумерацією від нуля"""
+    total = page_count(path)
+    start = min(window * window_pages, max(total - 1, 0))
+    return start, min(start + window_pages, total)
+
+
+def window_count(path, window_pages=DEFAULT_WINDOW_PAGES):
+    """Кількість вікон у документі"""
+    return max(1, (page_count(path) + window_pages - 1) // window_pages)
+
+
+def window_path(path, start, end, cache_dir=DEFAULT_CACHE_DIR):
+    """Шлях до PDF лише зі сторінками [start, end); створюється при першому запиті"""
+    digest = content_hash(path)[:16]
+    target = os.path.join(cache_dir, f"{digest}-{start + 1}-{end}.pdf")
+    if os.path.exists(target):
+        return target
+
+    with _lock:
+        target_lock = _locks.setdefault(target, threading.Lock())
+    with target_lock:
+        if not os.path.exists(target):
+            reader = PdfReader(path)
+            writer = PdfWriter()
+            for index in range(start, end):
+                writer.add_page(reader.pages[index])
+            with atomic_write(target, "wb") as f:
+                writer.write(f)
+    return target
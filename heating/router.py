@@ -0,0 +1,69 @@
+"""Маршрутизатор сторінок: перехід рендериться в тому ж перезапуску
+
+Кожна сторінка - зареєстрована функція. Перехід виконується колбеком
+віджета (він спрацьовує до перезапуску скрипта), тож додатковий st.rerun()
+не потрібен. Поточна сторінка відображається в параметрі ?page=, тому
+посилання на розділ можна відкрити напряму.
+"""
+import streamlit as st
+
+from heating import metrics
+
+PAGE_PARAM = "page"
+STATE_KEY = "current_page"
+# Кількість перезапусків від кліку до показу нової сторінки (очікується 1)
+PENDING_KEY = "_navigation_reruns"
+LAST_RERUNS_KEY = "last_navigation_reruns"
+
+
+class Router:
+    """Реєстр сторінок і стан навігації сесії"""
+
+    def __init__(self, default):
+        self.default = default
+        self.pages = {}
+
+    def page(self, label, slug):
+        """Декоратор реєстрації функції сторінки"""
+        def decorator(render):
+            self.pages[label] = (slug, render)
+            return render
+        return decorator
+
+    def label_for(self, slug):
+        for label, (page_slug, _) in self.pages.items():
+            if page_slug == slug:
+                return label
+        return None
+
+    def current(self):
+        """Сторінка поточного перезапуску; для нової сесії - з параметра ?page="""
+        state = st.session_state
+        if STATE_KEY not in state or state[STATE_KEY] not in self.pages:
+            state[STATE_KEY] = self.label_for(st.query_params.get(PAGE_PARAM)) or self.default
+        if PENDING_KEY in state:
+            state[PENDING_KEY] += 1
+        metrics.set_labels(page=state[STATE_KEY])
+        return state[STATE_KEY]
+
+    def navigate(self, label):
+        """Колбек переходу на сторінку"""
+        st.session_state[STATE_KEY] = label
+        st.session_state[PENDING_KEY] = 0
+
+    def render(self, label):
+        """Виклик функції сторінки та синхронізація ?page="""
+        slug, render = self.pages[label]
+        if label == self.default:
+            if PAGE_PARAM in st.query_params:
+                del st.query_params[PAGE_PARAM]
+        elif st.query_params.get(PAGE_PARAM) != slug:
+            st.query_params[PAGE_PARAM] = slug
+
+        reruns = st.session_state.pop(PENDING_KEY, None)
+        if reruns is not None:
+            st.session_state[LAST_RERUNS_KEY] = reruns
+            metrics.increment("navigations")
+            metrics.increment("navigation_reruns", reruns)
+
+        render()
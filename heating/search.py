@@ -0,0 +1,192 @@
+"""Повнотекстовий пошук по документах підприємства
+
+Текст кожної версії документа витягується один раз (heating.pdf_text), а
+словник "слово -> сторінки" зберігається на диску в кеші підприємства.
+Індекс оновлюється лише для документів, у яких змінився вміст (хеш), тож
+під час пошуку PDF не відкриваються. Назви документів теж індексуються:
+скановані тарифи без текстового шару знаходяться хоча б за назвою.
+"""
+import bisect
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+from heating.atomic import write_json
+from heating.blobs import content_hash
+from heating.optimize_pdfs import preferred_path
+from heating.pdf_text import cached_text, extract_text
+
+INDEX_VERSION = 1
+MAX_HITS = 10
+SNIPPET_CHARS = 60
+TOKEN_RE = re.compile(r"\w+")
+# Апостроф усередині слова (пам'ять, об'єкт) не розриває його
+APOSTROPHES = str.maketrans("", "", "'’ʼ`")
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def tokenize(text):
+    """Слова тексту в нижньому регістрі"""
+    return TOKEN_RE.findall(text.lower().translate(APOSTROPHES))
+
+
+@dataclass(frozen=True)
+class Hit:
+    key: str
+    title: str
+    path: str
+    pages: tuple
+    snippet: str
+
+
+def _snippet(text, tokens):
+    """Фрагмент тексту навколо першого знайденого слова"""
+    lowered = text.lower()
+    positions = [lowered.find(token) for token in tokens]
+    positions = [p for p in positions if p >= 0]
+    if not positions:
+        return ""
+    position = min(positions)
+    start = max(position - SNIPPET_CHARS, 0)
+    end = min(position + SNIPPET_CHARS, len(text))
+    snippet = " ".join(text[start:end].split())
+    return ("…" if start else "") + snippet + ("…" if end < len(text) else "")
+
+
+class SearchIndex:
+    """Індекс документів одного підприємства"""
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+        self.path = tenant.cache_dir("search", "index.json")
+        self.text_cache = tenant.cache_dir("text")
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._postings = {}
+        self._terms = []
+        self._build()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return {}
+            return data["documents"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _save(self):
+        write_json(self.path, {"version": INDEX_VERSION, "documents": self._entries})
+
+    def _build(self):
+        """Об'єднаний словник усіх документів: слово -> {ключ документа: сторінки}"""
+        postings = {}
+        for key, entry in self._entries.items():
+            for term in entry["title_terms"]:
+                postings.setdefault(term, {}).setdefault(key, [])
+            for term, pages in entry["terms"].items():
+                postings.setdefault(term, {})[key] = pages
+        self._postings = postings
+        self._terms = sorted(postings)
+
+    def _index_document(self, doc, path, signature, digest):
+        pages = extract_text(path, self.text_cache)
+        terms = {}
+        for number, text in enumerate(pages, start=1):
+            for term in set(tokenize(text)):
+                terms.setdefault(term, []).append(number)
+        return {
+            "path": path,
+            "signature": signature,
+            "hash": digest,
+            "title": doc.title,
+            "title_terms": sorted(set(tokenize(f"{doc.title} {doc.full_title} {doc.filename}"))),
+            "terms": terms,
+        }
+
+    def refresh(self):
+        """Оновлення індексу; PDF розбирається лише для нових версій документів"""
+        documents = self.tenant.config.documents
+        with self._lock:
+            entries = {}
+            changed = False
+            for doc in documents:
+                path = preferred_path(doc.path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                signature = [stat.st_mtime_ns, stat.st_size]
+                entry = self._entries.get(doc.key)
+                if entry and entry["path"] == path and entry["signature"] == signature and entry["title"] == doc.title:
+                    entries[doc.key] = entry
+                    continue
+                digest = content_hash(path)[:16]
+                if entry and entry["path"] == path and entry["hash"] == digest and entry["title"] == doc.title:
+                    entry = {**entry, "signature": signature}
+                else:
+                    entry = self._index_document(doc, path, signature, digest)
+                entries[doc.key] = entry
+                changed = True
+            if changed or entries.keys() != self._entries.keys():
+                self._entries = entries
+                self._save()
+                self._build()
+        return self
+
+    def _matches(self, token):
+        """Документи та сторінки для слова запиту (слово може бути початком слова з тексту)"""
+        found = {}
+        start = bisect.bisect_left(self._terms, token)
+        for term in self._terms[start:]:
+            if not term.startswith(token):
+                break
+            for key, pages in self._postings[term].items():
+                found.setdefault(key, set()).update(pages)
+        return found
+
+    def search(self, query, limit=MAX_HITS):
+        """Документи, де є всі слова запиту, зі сторінками та фрагментом тексту"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        self.refresh()
+        with self._lock:
+            entries = self._entries
+            results = None
+            for token in tokens:
+                found = self._matches(token)
+                if results is None:
+                    results = found
+                else:
+                    results = {key: results[key] | found[key] for key in results.keys() & found.keys()}
+                if not results:
+                    return []
+
+        order = list(entries)
+        ranked = sorted(results.items(), key=lambda item: (-len(item[1]), order.index(item[0])))
+        hits = []
+        for key, pages in ranked[:limit]:
+            entry = entries[key]
+            pages = tuple(sorted(pages))
+            snippet = ""
+            # Текст сторінок береться з кешу heating.pdf_text за хешем, PDF не відкривається
+            texts = cached_text(entry["hash"], self.text_cache) if pages else None
+            if texts and len(texts) >= pages[0]:
+                snippet = _snippet(texts[pages[0] - 1], tokens)
+            hits.append(Hit(key=key, title=entry["title"], path=entry["path"], pages=pages, snippet=snippet))
+        return hits
+
+
+def get_index(tenant):
+    """Спільний для всіх сесій індекс підприємства"""
+    with _indexes_lock:
+        index = _indexes.get(tenant.slug)
+        if index is None:
+            index = _indexes[tenant.slug] = SearchIndex(tenant)
+        return index
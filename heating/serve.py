@@ -0,0 +1,42 @@
+"""Запуск сайту: streamlit run app.py з маршрутами та прогрівом від самого старту
+
+    python -m heating.serve [параметри streamlit, наприклад --server.port 8501]
+
+Зі звичайним streamlit run маршрути (/_files, /_ready, готові сторінки)
+підключаються лише під час першої сесії. Тут вони додаються до
+tornado-застосунку одразу після його створення, і тоді ж у фоні
+запускається прогрів, тож перевірка здоров'я /_ready працює до першого
+відвідувача.
+"""
+import os
+import sys
+
+from streamlit.web import cli
+from streamlit.web.server.server import Server
+
+from heating import fast_path, metrics, warmup  # noqa: F401 (реєстрація маршрутів)
+from heating.server import mount
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def _patch_server():
+    create_app = Server._create_app
+
+    def _create_app(self):
+        app = create_app(self)
+        mount(app)
+        warmup.start()
+        return app
+
+    Server._create_app = _create_app
+
+
+def main(argv=None):
+    _patch_server()
+    args = sys.argv[1:] if argv is None else argv
+    cli.main(["run", APP_PATH, *args], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    main()
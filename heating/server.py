@@ -0,0 +1,75 @@
+"""Додаткові HTTP-маршрути на сервері Streamlit"""
+import gc
+import logging
+import threading
+
+import tornado.web
+from streamlit import config as st_config
+from streamlit.web.server.server_util import make_url_path_regex
+
+logger = logging.getLogger(__name__)
+
+_routes = []
+_apps = None
+_mounted = {}
+_lock = threading.Lock()
+
+
+def url_path(*parts):
+    """Публічний шлях з урахуванням server.baseUrlPath"""
+    base = st_config.get_option("server.baseUrlPath").strip("/")
+    path = "/".join(p.strip("/") for p in (base, *parts) if p)
+    return "/" + path
+
+
+def add_route(path, handler, kwargs=None):
+    """Реєстрація маршруту; шлях відносно server.baseUrlPath"""
+    with _lock:
+        if all(r[0] != path for r in _routes):
+            _routes.append((path, handler, kwargs or {}))
+
+
+def _find_apps():
+    return [obj for obj in gc.get_objects() if isinstance(obj, tornado.web.Application)]
+
+
+def _mount(app):
+    base = st_config.get_option("server.baseUrlPath")
+    done = _mounted.setdefault(id(app), set())
+    new_rules = [
+        (make_url_path_regex(base, path, trailing_slash=False), handler, kwargs)
+        for path, handler, kwargs in _routes
+        if path not in done
+    ]
+    if not new_rules:
+        return
+    app.add_handlers(r".*", new_rules)
+    done.update(path for path, _, _ in _routes)
+    logger.info("Підключено маршрутів: %d", len(new_rules))
+
+
+def mount(app):
+    """Підключення маршрутів до щойно створеного застосунку (див. heating.serve)"""
+    global _apps
+    with _lock:
+        if _apps is None:
+            _apps = []
+        if app not in _apps:
+            _apps.append(app)
+        _mount(app)
+
+
+def install_routes():
+    """Підключення зареєстрованих маршрутів до запущеного сервера
+
+    Streamlit не має API для власних маршрутів, тому tornado-застосунок шукаємо
+    (один раз на процес) серед живих об'єктів. Правила додаються перед маршрутами
+    Streamlit. Повертає False, якщо сервера немає (наприклад, у тестовому запуску).
+    """
+    global _apps
+    with _lock:
+        if _apps is None:
+            _apps = _find_apps()
+        for app in _apps:
+            _mount(app)
+        return bool(_apps)
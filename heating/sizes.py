@@ -0,0 +1,6 @@
+"""Розміри файлів у звітах консольних команд"""
+
+
+def format_size(size):
+    """Розмір у кілобайтах з пробілом між тисячами: 18 365 KB"""
+    return f"{size / 1024:,.0f} KB".replace(",", " ")
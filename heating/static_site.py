@@ -0,0 +1,384 @@
+"""HTML статичних сайтів підприємств (ті самі сторінки, що й у build.js)"""
+import os
+from dataclasses import dataclass
+
+PAGES = ("Головна", "Документи", "Фотогалерея", "Контакти")
+
+# Файл сторінки відносно папки сайту та шлях до спільного style.css
+PAGE_FILES = {
+    "Головна": ("index.html", "../style.css"),
+    "Документи": (os.path.join("documents", "index.html"), "../../style.css"),
+    "Фотогалерея": (os.path.join("gallery", "index.html"), "../../style.css"),
+    "Контакти": (os.path.join("contacts", "index.html"), "../../style.css"),
+}
+
+PAGE_URLS = {
+    "Головна": "",
+    "Документи": "/documents",
+    "Фотогалерея": "/gallery",
+    "Контакти": "/contacts",
+}
+
+NAV_ICONS = {
+    "Головна": "🏠",
+    "Документи": "📄",
+    "Фотогалерея": "📸",
+    "Контакти": "📞",
+}
+
+
+@dataclass(frozen=True)
+class StyleVariant:
+    header_class: str
+    nav_class: str
+    container_class: str
+    extra_styles: str
+
+
+STYLE_VARIANTS = {
+    "classic": StyleVariant(
+        header_class="",
+        nav_class="",
+        container_class="",
+        extra_styles="",
+    ),
+    "modern": StyleVariant(
+        header_class="header--modern",
+        nav_class="nav--modern",
+        container_class="",
+        extra_styles="""
+        .header--modern { padding: 2.5rem 0; box-shadow: 0 4px 20px rgba(0,0,0,0.15); }
+        .header--modern h1 { font-size: 2.8rem; letter-spacing: 1px; text-transform: uppercase; }
+        .nav--modern { background: #1a1a2e; border-bottom: none; }
+        .nav--modern .nav-link { color: #fff; opacity: 0.7; }
+        .nav--modern .nav-link:hover, .nav--modern .nav-link.active { opacity: 1; background: rgba(255,255,255,0.1); }
+        .nav--modern .nav-icon { font-size: 1.8rem; }
+        .info-box { border-left: none; border-radius: 20px; box-shadow: 0 10px 40px rgba(0,0,0,0.1); }
+        .nav-card { border-radius: 20px; border: none; box-shadow: 0 8px 30px rgba(0,0,0,0.12); }
+        .nav-card:hover { transform: translateY(-10px); box-shadow: 0 20px 60px rgba(0,0,0,0.2); }
+        .section-header { background: none; color: var(--primary-color); border-left: 5px solid var(--primary-color); padding-left: 1rem; }
+        """,
+    ),
+    "minimal": StyleVariant(
+        header_class="header--minimal",
+        nav_class="nav--minimal",
+        container_class="",
+        extra_styles="""
+        .header--minimal { background: var(--primary-color); padding: 1rem 0; }
+        .header--minimal h1 { font-size: 1.8rem; font-weight: 400; }
+        .nav--minimal { border-bottom: 1px solid #eee; }
+        .nav--minimal .nav-link { border-bottom: none; font-weight: 400; }
+        .nav--minimal .nav-link:hover, .nav--minimal .nav-link.active { background: none; color: var(--primary-color); }
+        .nav--minimal .nav-icon { display: none; }
+        .info-box { background: #fff; border: 1px solid #eee; border-left: 3px solid var(--primary-color); border-radius: 0; }
+        .nav-card { border-radius: 0; border: 1px solid #eee; box-shadow: none; }
+        .nav-card:hover { border-color: var(--primary-color); transform: none; box-shadow: none; }
+        .section-header { background: none; color: var(--text-color); font-weight: 400; border-bottom: 2px solid var(--primary-color); border-radius: 0; padding: 0.5rem 0; }
+        .btn { border-radius: 0; }
+        """,
+    ),
+    "corporate": StyleVariant(
+        header_class="header--corporate",
+        nav_class="nav--corporate",
+        container_class="",
+        extra_styles="""
+        .header--corporate { background: linear-gradient(180deg, var(--primary-color) 0%, var(--primary-color) 100%); padding: 1.2rem 0; text-align: left; }
+        .header--corporate h1 { max-width: 1200px; margin: 0 auto; padding: 0 1rem; font-size: 1.6rem; }
+        .nav--corporate { background: #2c2c2c; border-bottom: 4px solid var(--primary-color); }
+        .nav--corporate .nav-list { justify-content: flex-start; }
+        .nav--corporate .nav-link { color: #fff; padding: 1rem 1.5rem; }
+        .nav--corporate .nav-link:hover, .nav--corporate .nav-link.active { background: var(--primary-color); }
+        .nav--corporate .nav-icon { display: inline; margin-right: 8px; font-size: 1rem; }
+        .info-box { border-radius: 5px; border-left: 4px solid var(--primary-color); }
+        .nav-cards { grid-template-columns: repeat(3, 1fr); }
+        .nav-card { border-radius: 5px; border-top: 4px solid var(--primary-color); }
+        .section-header { background: var(--primary-color); border-radius: 0; }
+        .footer { background: #2c2c2c; color: #fff; }
+        .footer p { color: #ccc; }
+        """,
+    ),
+    "rounded": StyleVariant(
+        header_class="header--rounded",
+        nav_class="nav--rounded",
+        container_class="",
+        extra_styles="""
+        .header--rounded { border-radius: 0 0 50px 50px; padding: 2rem 0; }
+        .header--rounded h1 { font-size: 2rem; }
+        .nav--rounded { border-radius: 30px; margin: 1rem auto; max-width: 800px; box-shadow: 0 4px 15px rgba(0,0,0,0.1); border: none; }
+        .nav--rounded .nav-list { padding: 0.5rem; }
+        .nav--rounded .nav-link { border-radius: 20px; padding: 0.8rem 1.2rem; margin: 0.2rem; }
+        .nav--rounded .nav-link:hover, .nav--rounded .nav-link.active { background: var(--primary-color); color: #fff; }
+        .info-box { border-radius: 30px; border-left: none; border: 2px solid var(--primary-color); }
+        .nav-card { border-radius: 30px; }
+        .nav-card:hover { border-radius: 30px; }
+        .section-header { border-radius: 30px; text-align: center; }
+        .btn { border-radius: 25px; padding: 0.8rem 2rem; }
+        .tab-btn { border-radius: 20px; margin: 0.3rem; }
+        .tab-btn.active { background: var(--primary-color); color: #fff; border-bottom: none; }
+        .tabs { border-bottom: none; justify-content: center; }
+        .document-section { border-radius: 20px; }
+        .gallery-item img { border-radius: 30px; }
+        """,
+    ),
+    "sidebar": StyleVariant(
+        header_class="header--sidebar",
+        nav_class="nav--sidebar",
+        container_class="layout--sidebar",
+        extra_styles="""
+        body { display: flex; flex-direction: column; }
+        @media (min-width: 769px) {
+            .layout--sidebar { display: flex; }
+            .nav--sidebar { position: fixed; left: 0; top: 0; width: 220px; height: 100vh; flex-direction: column; border-bottom: none; border-right: 3px solid #E0E0E0; background: #f8f9fa; z-index: 100; }
+            .nav--sidebar .nav-list { flex-direction: column; padding-top: 80px; }
+            .nav--sidebar .nav-item { max-width: none; }
+            .nav--sidebar .nav-link { text-align: left; padding: 1rem 1.5rem; border-bottom: none; border-left: 4px solid transparent; }
+            .nav--sidebar .nav-link:hover, .nav--sidebar .nav-link.active { border-left-color: var(--primary-color); background: #fff; }
+            .header--sidebar { margin-left: 220px; text-align: left; padding-left: 2rem; }
+            .main { margin-left: 220px; }
+            .main .container { max-width: none; width: 100%; padding-right: 2rem; }
+            .footer { margin-left: 220px; }
+            .pdf-viewer { width: 100%; }
+            .gallery { width: 100%; }
+            .gallery-item img { max-width: 100%; }
+        }
+        .info-box { border-left: 4px solid var(--primary-color); }
+        .section-header { background: none; color: var(--primary-color); border-left: 4px solid var(--primary-color); padding-left: 1rem; }
+        """,
+    ),
+
+}
+
+
+class StaticUrls:
+    """Посилання для статичного хостингу: сайти лежать у папках <slug>/ (як у build.js)"""
+
+    def page(self, slug, page):
+        return f"/{slug}{PAGE_URLS[page]}"
+
+    def stylesheet(self, page):
+        return PAGE_FILES[page][1]
+
+    def document(self, doc):
+        return f"/{doc.folder}/{doc.filename}"
+
+    def download(self, doc):
+        return self.document(doc)
+
+    def photo(self, config, photo):
+        return f"/{config.gallery.folder}/{photo}"
+
+
+STATIC_URLS = StaticUrls()
+
+
+def _variant(config):
+    return STYLE_VARIANTS.get(config.theme.style_variant, STYLE_VARIANTS["classic"])
+
+
+def _head(config, title, stylesheet, rules):
+    theme = config.theme
+    primary_light = theme.primary_light or theme.primary_color
+    rules_css = "".join(f"        {rule}\n" for rule in rules)
+    return f"""<!DOCTYPE html>
+<html lang="uk">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="{stylesheet}">
+    <style>
+        :root {{ --primary-color: {theme.primary_color}; --secondary-color: {theme.secondary_color}; }}
+        .header {{ background: linear-gradient(135deg, var(--primary-color) 0%, {primary_light} 100%); }}
+        .nav-link:hover, .nav-link.active {{ color: var(--primary-color); border-bottom-color: var(--primary-color); }}
+        .btn {{ background-color: var(--primary-color); }}
+        .btn:hover {{ background-color: {theme.secondary_color}; }}
+{rules_css}        {_variant(config).extra_styles}
+    </style>
+</head>
+"""
+
+
+def _body_start(config, slug, active_page, urls):
+    variant = _variant(config)
+    nav_items = "\n".join(
+        f'            <li class="nav-item"><a href="{urls.page(slug, page)}" class="nav-link{" active" if page == active_page else ""}">'
+        f'<span class="nav-icon">{NAV_ICONS[page]}</span>{page}</a></li>'
+        for page in PAGES
+    )
+    return f"""<body>
+    <header class="header {variant.header_class}">
+        <h1>{config.company.name}</h1>
+    </header>
+    <nav class="nav {variant.nav_class}">
+        <ul class="nav-list">
+{nav_items}
+        </ul>
+    </nav>
+    <main class="main {variant.container_class}">
+        <div class="container">
+"""
+
+
+def _footer(config):
+    return f"""    <footer class="footer">
+        <p>&copy; 2025 {config.company.name}. Всі права захищено.</p>
+    </footer>
+"""
+
+
+def order_photos(present, configured):
+    """Спершу фото в порядку з конфігу, далі решта (нові) за алфавітом"""
+    present = set(present)
+    listed = [f for f in configured if f in present]
+    return listed + sorted(present.difference(listed))
+
+
+def gallery_files(config):
+    """Фото галереї в порядку показу"""
+    gallery = config.gallery
+    if not os.path.isdir(gallery.folder):
+        return list(gallery.files)
+    return order_photos(
+        (f for f in os.listdir(gallery.folder) if f.lower().endswith(gallery.supported_formats)),
+        gallery.files
+    )
+
+
+def render_index(config, slug, urls=STATIC_URLS):
+    description = "\n".join(
+        f"                <p>{paragraph.strip()}</p>"
+        for paragraph in config.company.description.strip().split("\n\n")
+        if paragraph.strip()
+    )
+    return _head(config, config.company.name, urls.stylesheet("Головна"), [
+        ".nav-card:hover { border-color: var(--primary-color); }",
+        ".tab-btn.active { color: var(--primary-color); border-bottom-color: var(--primary-color); }",
+        ".nav-card h3 { color: var(--primary-color); }",
+        ".contact-icon { color: var(--primary-color); }",
+        ".contact-item a { color: var(--primary-color); }",
+        ".info-box { border-left-color: var(--primary-color); }",
+    ]) + _body_start(config, slug, "Головна", urls) + f"""            <h2 class="section-header">Про нас</h2>
+            <div class="info-box">
+                <h3>{config.company.name}</h3>
+{description}
+            </div>
+            <div class="nav-cards">
+                <a href="{urls.page(slug, "Документи")}" class="nav-card">
+                    <h3>📄 Документи</h3>
+                    <p>Перегляньте наші офіційні документи та ліцензії</p>
+                    <span class="btn">Переглянути документи</span>
+                </a>
+                <a href="{urls.page(slug, "Фотогалерея")}" class="nav-card">
+                    <h3>📸 Фотогалерея</h3>
+                    <p>Дивіться фотографії нашого обладнання та об'єктів</p>
+                    <span class="btn">Відкрити галерею</span>
+                </a>
+                <a href="{urls.page(slug, "Контакти")}" class="nav-card">
+                    <h3>📞 Контакти</h3>
+                    <p>Зв'яжіться з нами для отримання інформації</p>
+                    <span class="btn">Наші контакти</span>
+                </a>
+            </div>
+        </div>
+    </main>
+""" + _footer(config) + """</body>
+</html>"""
+
+
+def render_documents(config, slug, urls=STATIC_URLS):
+    tabs = "\n                ".join(
+        f'<button class="tab-btn{" active" if i == 0 else ""}" onclick="openTab(event, \'{doc.key}\')">{doc.title}</button>'
+        for i, doc in enumerate(config.documents)
+    )
+    contents = "\n".join(f"""
+            <div id="{doc.key}" class="tab-content{" active" if i == 0 else ""}">
+                <div class="document-section">
+                    <h4>{doc.full_title}</h4>
+                    <div class="document-actions">
+                        <a href="{urls.download(doc)}" class="btn" download>⬇️ Завантажити документ</a>
+                    </div>
+                    <h4>📄 Перегляд документа:</h4>
+                    <embed src="{urls.document(doc)}" class="pdf-viewer" type="application/pdf">
+                </div>
+            </div>""" for i, doc in enumerate(config.documents))
+
+    return _head(config, f"Документи - {config.company.name}", urls.stylesheet("Документи"), [
+        ".tab-btn.active { color: var(--primary-color); border-bottom-color: var(--primary-color); }",
+        ".info-box { border-left-color: var(--primary-color); }",
+    ]) + _body_start(config, slug, "Документи", urls) + f"""            <h2 class="section-header">📑 Офіційні документи</h2>
+            <div class="tabs">
+                {tabs}
+            </div>
+{contents}
+        </div>
+    </main>
+""" + _footer(config) + """    <script>
+        function openTab(evt, tabName) {
+            document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+            document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
+            document.getElementById(tabName).classList.add('active');
+            evt.currentTarget.classList.add('active');
+        }
+    </script>
+</body>
+</html>"""
+
+
+def render_gallery(config, slug, urls=STATIC_URLS):
+    photos = "\n                ".join(
+        f'<div class="gallery-item"><img src="{urls.photo(config, photo)}" alt="{photo}" loading="lazy"></div>'
+        for photo in gallery_files(config)
+    )
+    return _head(config, f"Фотогалерея - {config.company.name}", urls.stylesheet("Фотогалерея"), [
+        ".info-box { border-left-color: var(--primary-color); }",
+    ]) + _body_start(config, slug, "Фотогалерея", urls) + f"""            <h2 class="section-header">📸 Фотогалерея</h2>
+            <div class="gallery">
+                {photos}
+            </div>
+        </div>
+    </main>
+""" + _footer(config) + """</body>
+</html>"""
+
+
+def render_contacts(config, slug, urls=STATIC_URLS):
+    contacts = config.contacts
+    address_html = f"""
+                    <li class="contact-item">
+                        <span class="contact-icon">📍</span>
+                        <div><strong>Адреси провадження господарської діяльності:</strong><br>{contacts.address}</div>
+                    </li>""" if contacts.address else ""
+    return _head(config, f"Контакти - {config.company.name}", urls.stylesheet("Контакти"), [
+        ".contact-icon { color: var(--primary-color); }",
+        ".contact-item a { color: var(--primary-color); }",
+        ".info-box { border-left-color: var(--primary-color); }",
+    ]) + _body_start(config, slug, "Контакти", urls) + f"""            <h2 class="section-header">📞 Контактна інформація</h2>
+            <div class="info-box">
+                <ul class="contact-list">
+                    <li class="contact-item">
+                        <span class="contact-icon">📞</span>
+                        <div><strong>Телефон:</strong><br><a href="tel:{contacts.phone_raw or contacts.phone}">{contacts.phone}</a></div>
+                    </li>
+                    <li class="contact-item">
+                        <span class="contact-icon">📧</span>
+                        <div><strong>Email:</strong><br><a href="mailto:{contacts.email}">{contacts.email}</a></div>
+                    </li>{address_html}
+                </ul>
+            </div>
+        </div>
+    </main>
+""" + _footer(config) + """</body>
+</html>"""
+
+
+RENDERERS = {
+    "Головна": render_index,
+    "Документи": render_documents,
+    "Фотогалерея": render_gallery,
+    "Контакти": render_contacts,
+}
+
+
+def render_page(config, slug, page, urls=STATIC_URLS):
+    """HTML однієї сторінки статичного сайту; urls визначає, куди ведуть посилання"""
+    return RENDERERS[page](config, slug, urls)
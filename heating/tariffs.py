@@ -0,0 +1,74 @@
+"""Значення тарифів, витягнуті з тексту PDF рішення про встановлення тарифу
+
+Рядки таблиці зберігаються на диску за хешем вмісту документа, тож PDF
+розбирається один раз на версію. Скани без текстового шару дають порожній
+список - тоді сайт показує сам документ.
+"""
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+
+from heating.atomic import write_json
+from heating.blobs import content_hash
+from heating.pdf_text import DEFAULT_CACHE_DIR as TEXT_CACHE_DIR
+from heating.pdf_text import extract_text
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "tariffs")
+TARIFFS_VERSION = 1
+
+# "тариф на теплову енергію у розмірі 3879,09 грн. (прописом) за 1 Гкал без податку на додану вартість"
+# або "тариф на теплову енергію - 3879,09 грн/Гкал з ПДВ"
+ROW_RE = re.compile(
+    r"тари\s?ф\w*\s+(?P<name>на\s[^.;:()]*?)\s*(?:(?:у|в)\s+розмір\w*|[-–—:])\s*"
+    r"(?P<value>\d{1,3}(?:[ \u00a0]?\d{3})*(?:[,.]\d{1,2})?)\s*грн\.?"
+    r"(?:\s*/\s*(?P<unit_inline>[^\s,.;()]+))?"
+    r"(?:\s*\([^)]*\))?"
+    r"(?:\s*за\s+1\s*(?P<unit>[^\s,.;()]+))?"
+    r"(?:\s*(?P<vat>(?:без|з)\s+(?:податку\s+на\s+додану\s+вартість|ПДВ)))?",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class TariffRow:
+    name: str
+    value: str
+    unit: str
+    vat: str
+    page: int
+
+
+def parse_tariffs(pages):
+    """Рядки тарифів з текстів сторінок"""
+    rows = []
+    for number, text in enumerate(pages, start=1):
+        # Рядки PDF розривають речення посередині, тому шукаємо в суцільному тексті
+        text = " ".join(text.split())
+        for match in ROW_RE.finditer(text):
+            unit = match.group("unit_inline") or match.group("unit") or ""
+            vat = (match.group("vat") or "").lower()
+            rows.append(TariffRow(
+                name="Тариф " + match.group("name").strip(),
+                value=re.sub(r"[ \u00a0]", "", match.group("value")).replace(".", ","),
+                unit=f"грн/{unit}" if unit else "грн",
+                vat="без ПДВ" if vat.startswith("без") else ("з ПДВ" if vat else ""),
+                page=number,
+            ))
+    return rows
+
+
+def extract_tariffs(path, cache_dir=DEFAULT_CACHE_DIR, text_cache_dir=TEXT_CACHE_DIR):
+    """Рядки тарифів документа; для нової версії файлу текст розбирається заново"""
+    target = os.path.join(cache_dir, f"{content_hash(path)[:16]}.json")
+    try:
+        with open(target, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == TARIFFS_VERSION:
+            return [TariffRow(**row) for row in data["rows"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    rows = parse_tariffs(extract_text(path, text_cache_dir))
+    write_json(target, {"version": TARIFFS_VERSION, "rows": [asdict(row) for row in rows]})
+    return rows
@@ -0,0 +1,182 @@
+"""Реєстр підприємств: один процес обслуговує всі сайти з configs/*.json"""
+import glob
+import json
+import logging
+import os
+import threading
+
+import toml
+
+from heating.config import ConfigStore
+
+BASE_CONFIG_PATH = "config.toml"
+SITE_CONFIGS_GLOB = os.path.join("configs", "*.json")
+DEFAULT_SLUG = "default"
+
+logger = logging.getLogger(__name__)
+
+
+def load_config(config_path=BASE_CONFIG_PATH):
+    """Завантаження конфігурації з config.toml"""
+    if os.path.exists(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            return toml.load(f)
+    else:
+        return {}
+
+
+def config_from_site_json(site, base_config):
+    """Перетворення configs/<slug>.json (формат build.js) у структуру config.toml
+
+    Технічні розділи (settings, menu, формати фото) беруться з основного конфігу.
+    """
+    slug = site["slug"]
+    docs_folder = os.path.join(slug, site.get("docsFolder", "docs"))
+    description = site.get("description", "")
+    if site.get("additionalInfo"):
+        description = f"{description}\n\n{site['additionalInfo']}"
+    addresses = site.get("addresses") or ([site["address"]] if site.get("address") else [])
+    base_theme = base_config.get("theme", {})
+
+    return {
+        "company": {
+            "name": site.get("companyName", slug),
+            "short_name": site.get("shortName", ""),
+            "icon": base_config.get("company", {}).get("icon", ""),
+            "tagline": base_config.get("company", {}).get("tagline", "Тепло для вашого комфорту"),
+            "description": description,
+        },
+        "contacts": {
+            "phone": site.get("phone", ""),
+            "phone_raw": site.get("phoneRaw", ""),
+            "email": site.get("email", ""),
+            "address": "<br>".join(addresses),
+        },
+        "documents": {
+            doc["id"]: {
+                "title": doc.get("title", doc["id"]),
+                "full_title": doc.get("fullTitle", doc.get("title", "")),
+                "filename": doc["file"],
+                "folder": docs_folder,
+            }
+            for doc in site.get("documents", [])
+        },
+        "menu": base_config.get("menu", {}),
+        "gallery": {
+            **base_config.get("gallery", {}),
+            "folder": os.path.join(slug, site.get("photosFolder", "photos")),
+            "files": list(site.get("photos", [])),
+        },
+        "theme": {
+            **base_theme,
+            "primary_color": site.get("color", base_theme.get("primary_color", "#FF6B35")),
+            "secondary_color": site.get("colorDark", base_theme.get("secondary_color", "#E55A2B")),
+            "primary_light": site.get("colorLight", ""),
+            "style_variant": site.get("styleVariant", "classic"),
+        },
+        "footer": {
+            "copyright": f"© 2025 {site.get('companyName', slug)}. Всі права захищено.",
+            "show_tagline": False,
+        },
+        "settings": base_config.get("settings", {}),
+        "tenants": {},
+    }
+
+
+def _read_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class Tenant:
+    """Одне підприємство: slug і сховище його конфігурації"""
+
+    def __init__(self, slug, store):
+        self.slug = slug
+        self.store = store
+
+    @property
+    def config(self):
+        """Чинний типізований знімок конфігурації (SiteConfig)"""
+        return self.store.get()
+
+    def cache_dir(self, *parts):
+        """Окрема папка згенерованих файлів для кожного підприємства"""
+        return os.path.join(self.config.settings.cache_dir, self.slug, *parts)
+
+
+def _site_slug(path):
+    """Slug підприємства з його конфігу; для пошкодженого файлу - ім'я файлу без розширення
+
+    Помилку розбору такого файлу ConfigStore покаже при першому зверненні до
+    підприємства, решта сайтів процесу продовжує працювати.
+    """
+    try:
+        return _read_json(path)["slug"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        slug = os.path.splitext(os.path.basename(path))[0]
+        logger.warning("Не вдалося прочитати slug з %s (%s), використано %r", path, e, slug)
+        return slug
+
+
+class TenantRegistry:
+    """Підприємства процесу; конфігурації перечитуються лише при зміні файлів"""
+
+    def __init__(self, base_config_path=BASE_CONFIG_PATH, sites_glob=SITE_CONFIGS_GLOB):
+        self.base_config_path = base_config_path
+        self.tenants = {
+            DEFAULT_SLUG: Tenant(DEFAULT_SLUG, ConfigStore([base_config_path], lambda: load_config(base_config_path)))
+        }
+        for path in sorted(glob.glob(sites_glob)):
+            slug = _site_slug(path)
+            store = ConfigStore(
+                [path, base_config_path],
+                lambda path=path: config_from_site_json(_read_json(path), load_config(base_config_path))
+            )
+            self.tenants[slug] = Tenant(slug, store)
+
+    @property
+    def _tenants_config(self):
+        return self.tenants[DEFAULT_SLUG].config.raw.get("tenants", {})
+
+    @property
+    def default_slug(self):
+        return self._tenants_config.get("default", DEFAULT_SLUG)
+
+    @property
+    def hosts(self):
+        return {host.lower(): slug for host, slug in self._tenants_config.get("hosts", {}).items()}
+
+    def get(self, slug):
+        return self.tenants.get(slug)
+
+    def resolve(self, requested=None, host=None):
+        """Вибір підприємства: параметр ?tenant=, потім ім'я хоста, потім підприємство за замовчуванням"""
+        if requested and requested in self.tenants:
+            return self.tenants[requested]
+        if host:
+            hostname = host.split(":", 1)[0].lower()
+            slug = self.hosts.get(hostname)
+            if slug is None:
+                # Піддомен на кшталт ternopil-teplo.teplo.biz.ua
+                slug = hostname.split(".", 1)[0]
+            if slug in self.tenants:
+                return self.tenants[slug]
+        return self.tenants.get(self.default_slug, self.tenants[DEFAULT_SLUG])
+
+    def stats(self):
+        """Лічильники перезавантажень конфігурацій"""
+        return {slug: tenant.store.stats() for slug, tenant in self.tenants.items()}
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Спільний для всіх сесій реєстр підприємств"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TenantRegistry()
+        return _registry
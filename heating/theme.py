@@ -0,0 +1,410 @@
+"""Стилі сайту, скомпільовані один раз на тему у файл з хешем вмісту в імені"""
+import hashlib
+import os
+import threading
+
+from heating.atomic import write_atomic
+from heating.file_server import file_url
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "theme")
+
+# Шаблон стилів; кольори підставляються з розділу [theme]
+THEME_CSS_TEMPLATE = """\
+.main-header {{
+    font-size: 4rem;
+    font-weight: bold;
+    color: {primary_color};
+    text-align: center;
+    padding: 1.5rem 0;
+    margin-bottom: 1.5rem;
+}}
+
+.section-header {{
+    font-size: 2rem;
+    font-weight: bold;
+    color: {text_color};
+    margin-top: 2rem;
+    margin-bottom: 1rem;
+    padding: 0.5rem;
+    background: linear-gradient(90deg, {primary_color} 0%, transparent 100%);
+    border-radius: 5px;
+}}
+
+.info-box {{
+    background-color: {bg_light};
+    padding: 1.5rem;
+    border-radius: 10px;
+    border-left: 5px solid {primary_color};
+    margin-bottom: 1rem;
+}}
+
+.contact-item {{
+    font-size: 1.1rem;
+    padding: 0.5rem 0;
+    display: flex;
+    align-items: center;
+}}
+
+.contact-icon {{
+    color: {primary_color};
+    margin-right: 10px;
+    font-size: 1.3rem;
+}}
+
+.document-card {{
+    background-color: white;
+    padding: 1.5rem;
+    border-radius: 10px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    margin-bottom: 1rem;
+    border: 1px solid #E0E0E0;
+    transition: transform 0.2s;
+}}
+
+.document-card:hover {{
+    transform: translateY(-5px);
+    box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+}}
+
+/* Навігаційні картки */
+.nav-card {{
+    background: linear-gradient(135deg, {bg_light} 0%, white 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    border: 2px solid {bg_light};
+    transition: all 0.3s ease;
+    height: 100%;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+}}
+
+.nav-card:hover {{
+    border-color: {primary_color};
+    box-shadow: 0 4px 16px rgba(255, 107, 53, 0.2);
+    transform: translateY(-5px);
+}}
+
+.nav-card h3 {{
+    color: {primary_color};
+    margin-bottom: 0.5rem;
+}}
+
+.nav-card p {{
+    color: {text_muted};
+    font-size: 0.95rem;
+    margin-bottom: 1rem;
+}}
+
+.photo-caption {{
+    text-align: center;
+    color: {text_muted};
+    font-style: italic;
+    margin-top: 0.5rem;
+}}
+
+/* Сітка мініатюр галереї */
+.gallery-grid {{
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(220px, 1fr));
+    gap: 1rem;
+    margin-bottom: 1rem;
+}}
+
+.gallery-grid a {{
+    display: block;
+    border-radius: 10px;
+    overflow: hidden;
+    background-color: {bg_light};
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    transition: transform 0.2s;
+}}
+
+.gallery-grid a:hover {{
+    transform: translateY(-5px);
+}}
+
+.gallery-grid img {{
+    display: block;
+    aspect-ratio: 4 / 3;
+    object-fit: cover;
+}}
+
+.stButton>button {{
+    background-color: {primary_color};
+    color: white;
+    border-radius: 5px;
+    padding: 0.5rem 2rem;
+    font-weight: bold;
+    border: none;
+    transition: background-color 0.3s;
+}}
+
+.stButton>button:hover {{
+    background-color: {secondary_color};
+}}
+
+div[data-testid="stFileUploader"] {{
+    background-color: {bg_light};
+    padding: 1rem;
+    border-radius: 10px;
+    border: 2px dashed {primary_color};
+}}
+
+/* Навігаційне меню */
+.nav-container {{
+    display: flex;
+    justify-content: center;
+    gap: 0;
+    margin-bottom: 3rem;
+    border-bottom: 3px solid #E0E0E0;
+}}
+
+.nav-item {{
+    flex: 1;
+    max-width: 250px;
+    text-align: center;
+    padding: 1.2rem 2rem;
+    cursor: pointer;
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: {text_muted};
+    background-color: #FFFFFF;
+    border: none;
+    border-bottom: 3px solid transparent;
+    transition: all 0.3s ease;
+    text-decoration: none;
+    position: relative;
+}}
+
+.nav-item:hover {{
+    color: {primary_color};
+    background-color: #FFF5F2;
+    border-bottom: 3px solid {primary_color};
+}}
+
+.nav-item.active {{
+    color: {primary_color};
+    background-color: #FFF5F2;
+    border-bottom: 3px solid {primary_color};
+}}
+
+.nav-icon {{
+    font-size: 1.5rem;
+    display: block;
+    margin-bottom: 0.3rem;
+}}
+
+/* Sidebar стилізація */
+[data-testid="stSidebar"] {{
+    background: linear-gradient(180deg, {primary_color} 0%, {secondary_color} 100%);
+}}
+
+[data-testid="stSidebar"] * {{
+    color: white !important;
+}}
+
+[data-testid="stSidebar"] h2 {{
+    color: white !important;
+    font-size: 1.5rem !important;
+    margin-bottom: 0 !important;
+}}
+
+[data-testid="stSidebar"] h3 {{
+    color: white !important;
+    font-size: 1.2rem !important;
+}}
+
+[data-testid="stSidebar"] .stRadio > label {{
+    color: white !important;
+    font-weight: 600;
+    font-size: 1.1rem;
+}}
+
+/* Приховуємо radio кнопки (кружечки) */
+[data-testid="stSidebar"] [role="radiogroup"] input[type="radio"] {{
+    opacity: 0;
+    width: 0;
+    height: 0;
+    position: absolute;
+}}
+
+[data-testid="stSidebar"] [role="radiogroup"] label {{
+    background-color: rgba(255, 255, 255, 0.15);
+    padding: 1rem 1.5rem;
+    border-radius: 10px;
+    margin-bottom: 0.5rem;
+    transition: all 0.3s;
+    cursor: pointer;
+    font-size: 1.1rem;
+    display: flex;
+    align-items: center;
+    width: 100%;
+}}
+
+[data-testid="stSidebar"] [role="radiogroup"] label p {{
+    color: white !important;
+    margin: 0;
+    font-size: 1.1rem;
+}}
+
+[data-testid="stSidebar"] [role="radiogroup"] label:hover {{
+    background-color: rgba(255, 255, 255, 0.25);
+    transform: translateX(5px);
+    box-shadow: 0 2px 8px rgba(0,0,0,0.2);
+}}
+
+[data-testid="stSidebar"] [role="radiogroup"] label[data-checked="true"] {{
+    background-color: white;
+    color: {primary_color} !important;
+    border-left: 5px solid #FFC107;
+    font-weight: bold;
+}}
+
+[data-testid="stSidebar"] [role="radiogroup"] label[data-checked="true"] p {{
+    color: {primary_color} !important;
+}}
+
+/* Приховуємо кружечок radio */
+[data-testid="stSidebar"] [role="radiogroup"] label > div:first-child {{
+    display: none !important;
+}}
+
+[data-testid="stSidebar"] hr {{
+    border-color: rgba(255, 255, 255, 0.3) !important;
+    margin: 1rem 0 !important;
+}}
+
+[data-testid="stSidebar"] .element-container {{
+    color: white !important;
+}}
+
+[data-testid="stSidebar"] .stAlert {{
+    background-color: rgba(255, 255, 255, 0.2) !important;
+    border: 1px solid rgba(255, 255, 255, 0.3) !important;
+    color: white !important;
+}}
+
+section[data-testid="stSidebar"] > div {{
+    padding-top: 2rem;
+}}
+
+/* === МОБІЛЬНА АДАПТАЦІЯ === */
+@media only screen and (max-width: 768px) {{
+    .main-header {{
+        font-size: 2.5rem !important;
+        padding: 1rem 0 !important;
+    }}
+
+    .section-header {{
+        font-size: 1.5rem !important;
+        padding: 0.3rem !important;
+    }}
+
+    .info-box {{
+        padding: 1rem !important;
+    }}
+
+    .contact-item {{
+        font-size: 1rem !important;
+        padding: 0.3rem 0 !important;
+    }}
+
+    .nav-item {{
+        padding: 0.8rem 1rem !important;
+        font-size: 0.9rem !important;
+    }}
+
+    /* Sidebar на мобільних */
+    [data-testid="stSidebar"] {{
+        width: 280px !important;
+    }}
+
+    [data-testid="stSidebar"] [role="radiogroup"] label {{
+        padding: 0.8rem 1rem !important;
+        font-size: 1rem !important;
+    }}
+
+    /* Навігаційні картки на планшетах */
+    .nav-card {{
+        padding: 1rem !important;
+    }}
+
+    .nav-card h3 {{
+        font-size: 1.2rem !important;
+    }}
+
+    .nav-card p {{
+        font-size: 0.85rem !important;
+    }}
+}}
+
+/* Дуже маленькі екрани */
+@media only screen and (max-width: 480px) {{
+    .main-header {{
+        font-size: 2rem !important;
+    }}
+
+    .section-header {{
+        font-size: 1.3rem !important;
+    }}
+
+    /* Навігаційні картки на телефонах */
+    .nav-card {{
+        padding: 0.8rem !important;
+        margin-bottom: 1rem !important;
+    }}
+
+    .nav-card h3 {{
+        font-size: 1.1rem !important;
+    }}
+
+    .nav-card p {{
+        font-size: 0.8rem !important;
+    }}
+
+    [data-testid="stSidebar"] {{
+        width: 100% !important;
+    }}
+}}
+"""
+
+_compiled = {}
+_lock = threading.Lock()
+
+
+def render_css(theme):
+    """Текст стилів для теми"""
+    return THEME_CSS_TEMPLATE.format(
+        primary_color=theme.primary_color,
+        secondary_color=theme.secondary_color,
+        text_color=theme.text_color,
+        bg_light=theme.background_light,
+        text_muted=theme.text_muted,
+    )
+
+
+def compile_theme(theme, cache_dir=DEFAULT_CACHE_DIR):
+    """Шлях до файлу стилів теми; створюється один раз на хеш вмісту"""
+    key = (theme, cache_dir)
+    with _lock:
+        path = _compiled.get(key)
+    if path is not None and os.path.exists(path):
+        return path
+
+    css = render_css(theme)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    path = os.path.join(cache_dir, f"theme-{digest}.css")
+    if not os.path.exists(path):
+        write_atomic(path, css)
+    with _lock:
+        _compiled[key] = path
+    return path
+
+
+def stylesheet_html(theme, cache_dir=DEFAULT_CACHE_DIR, tenant=None, served=True):
+    """Посилання на скомпільований файл стилів (браузер кешує його назавжди)
+
+    Якщо маршрути сервера недоступні, стилі вбудовуються безпосередньо.
+    """
+    if not served:
+        return f"<style>\n{render_css(theme)}</style>"
+    return f'<link rel="stylesheet" href="{file_url(compile_theme(theme, cache_dir), tenant)}">'
@@ -0,0 +1,145 @@
+"""Прогрів процесу після запуску та ендпоінт готовності /_ready
+
+Після деплою перші відвідувачі не мають чекати на розбір конфігів, читання
+документів, пошуковий індекс, розміри фото, компіляцію стилів і готові
+сторінки: усе це робиться один раз у фоновому потоці. /_ready відповідає 503,
+доки прогрів не завершено, і 200 після нього; в обох випадках у тілі -
+тривалість кожного кроку.
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+import tornado.web
+
+from heating import metrics
+from heating.blobs import store
+from heating.doc_cache import get_document_cache
+from heating.fast_path import FAST_PATH_PAGES, page_html
+from heating.gallery import get_manifest
+from heating.optimize_pdfs import preferred_path
+from heating.pdf_windows import page_count
+from heating.search import get_index
+from heating.server import add_route
+from heating.tariffs import extract_tariffs
+from heating.tenants import get_registry
+from heating.theme import compile_theme
+
+logger = logging.getLogger(__name__)
+
+READY_ENDPOINT = "_ready"
+
+_steps = []
+_lock = threading.Lock()
+_thread = None
+_started = None
+_finished = None
+
+
+def _warm_documents(tenant, config):
+    settings = config.settings
+    cache = get_document_cache(settings.document_cache_mb, tenant=tenant.slug)
+    for doc in config.documents:
+        path = preferred_path(doc.path)
+        if not os.path.exists(path):
+            continue
+        if os.path.getsize(path) / (1024 * 1024) > settings.pdf_window_mb:
+            # Великі документи показуються вікнами - досить знати кількість сторінок
+            page_count(path)
+        else:
+            # Сервер читає файл зі спільного сховища, тож і прогріваємо blob
+            cache.get(store(path))
+        if doc.key.startswith("tariff"):
+            extract_tariffs(path, tenant.cache_dir("tariffs"), tenant.cache_dir("text"))
+
+
+def _warm_gallery(tenant, config):
+    gallery = config.gallery
+    if os.path.isdir(gallery.folder):
+        get_manifest(gallery.folder, gallery.supported_formats, tenant.cache_dir("images")).photos()
+
+
+def _warm_pages(tenant, config):
+    if config.settings.fast_path:
+        for page in FAST_PATH_PAGES:
+            page_html(tenant, page)
+
+
+STEPS = (
+    ("theme", lambda tenant, config: compile_theme(config.theme, tenant.cache_dir("theme"))),
+    ("documents", _warm_documents),
+    ("gallery", _warm_gallery),
+    ("search", lambda tenant, config: get_index(tenant).refresh()),
+    ("pages", _warm_pages),
+)
+
+
+def _record(tenant, step, started, error=None):
+    seconds = time.perf_counter() - started
+    with _lock:
+        _steps.append({"tenant": tenant, "step": step, "seconds": round(seconds, 4), "error": error})
+    metrics.set_labels(tenant=tenant, page="")
+    metrics.observe(f"warmup_{step}", seconds)
+
+
+def _run():
+    global _finished
+    for slug, tenant in get_registry().tenants.items():
+        started = time.perf_counter()
+        try:
+            config = tenant.config
+        except Exception as e:
+            _record(slug, "config", started, str(e))
+            logger.warning("Прогрів %s: конфіг не завантажено: %s", slug, e)
+            continue
+        _record(slug, "config", started)
+
+        for step, warm in STEPS:
+            started = time.perf_counter()
+            try:
+                warm(tenant, config)
+                _record(slug, step, started)
+            except Exception as e:
+                # Помилка прогріву не зупиняє сервер: сторінка зробить те саме при запиті
+                _record(slug, step, started, str(e))
+                logger.warning("Прогрів %s/%s: %s", slug, step, e)
+    _finished = time.perf_counter()
+    logger.info("Прогрів завершено за %.2f с", _finished - _started)
+
+
+def start():
+    """Запуск прогріву у фоновому потоці (один раз на процес)"""
+    global _thread, _started
+    with _lock:
+        if _thread is None:
+            _started = time.perf_counter()
+            _thread = threading.Thread(target=_run, name="warmup", daemon=True)
+            _thread.start()
+    return _thread
+
+
+def status():
+    """Стан прогріву: чи готовий процес і скільки тривав кожен крок"""
+    with _lock:
+        steps = list(_steps)
+    if _started is None:
+        seconds = None
+    else:
+        seconds = round((_finished or time.perf_counter()) - _started, 4)
+    return {"ready": _finished is not None, "seconds": seconds, "steps": steps}
+
+
+class ReadyHandler(tornado.web.RequestHandler):
+    """GET /_ready"""
+
+    def get(self):
+        state = status()
+        self.set_status(200 if state["ready"] else 503)
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+        self.set_header("Cache-Control", "no-store")
+        self.write(json.dumps(state, ensure_ascii=False))
+
+
+add_route(READY_ENDPOINT, ReadyHandler)
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from heating.assets import HASHED_NAME_RE, MANIFEST_FILENAME, fingerprint
+from heating.export import export
+from heating.static_site import gallery_files
+from heating.tenants import get_registry
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SLUG = "ternopil-teplo"
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+
+def test_fingerprint_keeps_source_folders(repo, tmp_path):
+    config = get_registry().get(SLUG).config
+    photos = gallery_files(config)
+    folder_files = sorted(os.listdir(config.gallery.folder))
+
+    export(str(tmp_path), [SLUG], jobs=1, force=True)
+    manifest = fingerprint(str(tmp_path))
+
+    assert any(HASHED_NAME_RE.match(os.path.basename(entry["hashed"])) for entry in manifest.values())
+    assert (tmp_path / MANIFEST_FILENAME).exists()
+    assert gallery_files(config) == photos
+    assert sorted(os.listdir(config.gallery.folder)) == folder_files
+
+
+def test_fingerprint_refuses_source_tree(repo):
+    before = sorted(os.listdir(ROOT))
+    with pytest.raises(ValueError):
+        fingerprint(".")
+    assert sorted(os.listdir(ROOT)) == before
@@ -0,0 +1,69 @@
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from heating import blobs, ingest
+from heating.blobs import deduplicate, store
+from heating.doc_cache import get_document_cache
+from heating.sizes import format_size
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    root = str(tmp_path / "blobs")
+    monkeypatch.setattr(blobs, "default_root", lambda: root)
+    return root
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_identical_files_share_one_blob(tmp_path, root):
+    a = write(tmp_path / "ternopil" / "license.pdf", b"%PDF same" * 100)
+    b = write(tmp_path / "zbarazh" / "license.pdf", b"%PDF same" * 100)
+    c = write(tmp_path / "zbarazh" / "tariff.pdf", b"%PDF other")
+
+    rows, saved = deduplicate([a, b, c])
+    assert rows[0][2] == rows[1][2] != rows[2][2]
+    assert os.path.dirname(rows[0][2]).startswith(root)
+    # Без --link другий файл ще окрема копія
+    assert saved == 0
+
+    rows, saved = deduplicate([a, b, c], link=True)
+    assert all(shared for _, _, _, shared in rows)
+    assert os.path.samefile(a, b)
+    assert saved == 900
+
+
+def test_upload_invalidates_replaced_blob(tmp_path, root, monkeypatch):
+    monkeypatch.setattr(ingest, "submit", lambda tenant, path, kind: path)
+    folder = tmp_path / "docs"
+    path = write(folder / "tariff.pdf", b"%PDF old")
+    old_blob = os.path.abspath(store(path))
+    tenant_cache = get_document_cache(tenant="test-ingest")
+    shared_cache = get_document_cache(tenant=None)
+    for cache in (tenant_cache, shared_cache):
+        cache.get(old_blob)
+
+    upload = io.BytesIO(b"%PDF new")
+    upload.name = "tariff.pdf"
+    ingest.ingest(SimpleNamespace(slug="test-ingest"), upload, str(folder), "document")
+
+    # Старий blob лишається на диску, але з кешів його вміст прибрано
+    for cache in (tenant_cache, shared_cache):
+        misses = cache.stats()["misses"]
+        cache.get(old_blob)
+        assert cache.stats()["misses"] == misses + 1
+    with open(path, "rb") as f:
+        assert f.read() == b"%PDF new"
+    assert os.path.abspath(store(path)) != old_blob
+
+
+def test_format_size():
+    assert format_size(18806784) == "18 366 KB"
+    assert format_size(0) == "0 KB"
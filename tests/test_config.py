@@ -0,0 +1,76 @@
+import os
+
+import pytest
+import toml
+
+from heating.config import ConfigError, ConfigStore, parse_config
+from heating.metrics import render_prometheus
+
+
+def test_defaults():
+    config = parse_config({})
+    assert config.settings.document_cache_mb > 0
+    assert config.menu
+    assert config.hash == parse_config({}).hash
+
+
+@pytest.mark.parametrize("raw", [
+    [],
+    {"company": "ТОВ"},
+    {"company": {"name": 1}},
+    {"documents": {"license": "Ліцензія.pdf"}},
+    {"menu": {"items": [{"icon": "🏠"}]}},
+    {"gallery": {"files": "photo.jpg"}},
+    {"gallery": {"page_size": 0}},
+    {"gallery": {"page_size": True}},
+    {"theme": {"primary_color": "червоний"}},
+    {"footer": {"show_tagline": "так"}},
+    {"settings": {"document_cache_mb": -1}},
+    {"settings": {"pdf_window_pages": "5"}},
+    {"settings": {"fast_path": 1}},
+])
+def test_rejects_bad_values(raw):
+    with pytest.raises(ConfigError):
+        parse_config(raw)
+
+
+def write(path, raw, mtime_ns):
+    path.write_text(toml.dumps(raw), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_store_keeps_previous_snapshot(tmp_path):
+    path = tmp_path / "config.toml"
+    write(path, {"company": {"name": "Стара назва"}}, 10 ** 9)
+    store = ConfigStore([str(path)], lambda: toml.load(str(path)))
+    assert store.get().company.name == "Стара назва"
+
+    write(path, {"theme": {"primary_color": "червоний"}}, 2 * 10 ** 9)
+    assert store.get().company.name == "Стара назва"
+    assert store.stats()["error_count"] == 1
+    assert "primary_color" in store.stats()["last_error"]
+
+    path.write_text("[company\nname = ", encoding="utf-8")
+    os.utime(path, ns=(3 * 10 ** 9, 3 * 10 ** 9))
+    assert store.get().company.name == "Стара назва"
+    assert store.stats()["error_count"] == 2
+
+    write(path, {"company": {"name": "Нова назва"}}, 4 * 10 ** 9)
+    assert store.get().company.name == "Нова назва"
+    assert store.stats()["reload_count"] == 2
+    assert store.stats()["last_error"] is None
+
+
+def test_store_first_load_error(tmp_path):
+    path = tmp_path / "config.toml"
+    write(path, {"settings": {"fast_path": "так"}}, 10 ** 9)
+    store = ConfigStore([str(path)], lambda: toml.load(str(path)))
+    with pytest.raises(ConfigError):
+        store.get()
+
+
+def test_parse_seconds_exported(monkeypatch):
+    monkeypatch.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    text = render_prometheus()
+    assert "# TYPE heating_config_parse_seconds gauge" in text
+    assert 'heating_config_parse_seconds{tenant="ternopil-teplo"}' in text
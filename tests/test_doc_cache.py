@@ -0,0 +1,94 @@
+import os
+
+from heating.doc_cache import DocumentCache
+
+
+def write(path, size, fill=b"x"):
+    path.write_bytes(fill * size)
+    return str(path)
+
+
+def test_hit_miss_and_byte_counters(tmp_path):
+    cache = DocumentCache(1000)
+    path = write(tmp_path / "a.pdf", 100)
+
+    assert cache.get(path) == b"x" * 100
+    assert cache.get(path) == b"x" * 100
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["bytes_read"] == 100
+    assert stats["bytes_cached"] == 100
+    assert stats["entries"] == 1
+
+
+def test_budget_evicts_least_recently_used(tmp_path):
+    cache = DocumentCache(250)
+    a = write(tmp_path / "a.pdf", 100)
+    b = write(tmp_path / "b.pdf", 100)
+    c = write(tmp_path / "c.pdf", 100)
+
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)  # b тепер найдавніший
+    cache.get(c)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes_cached"] == 200
+    cache.get(a)
+    cache.get(c)
+    assert cache.stats()["misses"] == 3
+    cache.get(b)
+    assert cache.stats()["misses"] == 4
+
+
+def test_file_larger_than_budget_is_not_cached(tmp_path):
+    cache = DocumentCache(50)
+    path = write(tmp_path / "big.pdf", 100)
+
+    assert len(cache.get(path)) == 100
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes_cached"] == 0
+
+
+def test_changed_file_replaces_old_version(tmp_path):
+    cache = DocumentCache(1000)
+    path = write(tmp_path / "a.pdf", 100)
+    cache.get(path)
+
+    write(tmp_path / "a.pdf", 150, b"y")
+    os.utime(path, ns=(0, 10 ** 9))
+    assert cache.get(path) == b"y" * 150
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes_cached"] == 150
+
+
+def test_invalidate(tmp_path):
+    cache = DocumentCache(1000)
+    a = write(tmp_path / "a.pdf", 100)
+    b = write(tmp_path / "b.pdf", 100)
+    cache.get(a)
+    cache.get(b)
+
+    cache.invalidate(a)
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["bytes_cached"] == 100
+    cache.get(a)
+    assert cache.stats()["misses"] == 3
+
+    cache.invalidate()
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes_cached"] == 0
+
+
+def test_set_budget_trims(tmp_path):
+    cache = DocumentCache(1000)
+    for name in ("a", "b", "c"):
+        cache.get(write(tmp_path / f"{name}.pdf", 100))
+
+    cache.set_budget(150)
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["budget_bytes"] == 150
@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+from urllib.parse import quote
+
+import tornado.web
+from tornado.testing import AsyncHTTPTestCase
+
+from heating.doc_cache import get_document_cache
+from heating.file_server import FILES_ENDPOINT, FileHandler, content_disposition, file_url
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTENT = bytes(range(256)) * 40
+
+
+class FileHandlerTest(AsyncHTTPTestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "Ліцензія №1.pdf")
+        with open(self.path, "wb") as f:
+            f.write(CONTENT)
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.folder)
+        os.chdir(self._cwd)
+
+    def get_app(self):
+        return tornado.web.Application([(f"/{FILES_ENDPOINT}/(.*)", FileHandler, {"path": ""})])
+
+    def test_full_file_with_version_is_immutable(self):
+        response = self.fetch(file_url(self.path, "ternopil-teplo"))
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.body, CONTENT)
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        self.assertIn("ETag", response.headers)
+
+    def test_without_version_is_revalidated(self):
+        url = file_url(self.path, "ternopil-teplo").split("?", 1)[0]
+        response = self.fetch(url)
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+
+    def test_range(self):
+        response = self.fetch(file_url(self.path, "ternopil-teplo"), headers={"Range": "bytes=100-199"})
+        self.assertEqual(response.code, 206)
+        self.assertEqual(response.body, CONTENT[100:200])
+        self.assertEqual(response.headers["Content-Range"], f"bytes 100-199/{len(CONTENT)}")
+
+    def test_if_none_match(self):
+        url = file_url(self.path, "ternopil-teplo")
+        etag = self.fetch(url).headers["ETag"]
+        response = self.fetch(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.code, 304)
+        self.assertEqual(response.body, b"")
+
+    def test_unknown_id_and_traversal(self):
+        self.assertEqual(self.fetch(f"/{FILES_ENDPOINT}/0123456789abcdef/x.pdf").code, 404)
+        self.assertEqual(self.fetch(f"/{FILES_ENDPOINT}/%2E%2E/config.toml").code, 404)
+        self.assertEqual(self.fetch(f"/{FILES_ENDPOINT}/../../config.toml").code, 404)
+
+    def test_download_header(self):
+        response = self.fetch(file_url(self.path, "ternopil-teplo", download=True))
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.body, CONTENT)
+        self.assertEqual(response.headers["Content-Disposition"], content_disposition("Ліцензія №1.pdf"))
+
+
+def test_content_disposition():
+    filename = 'Тариф "2024".pdf'
+    header = content_disposition(filename)
+    assert header == f"attachment; filename=\"_____ _2024_.pdf\"; filename*=UTF-8''{quote(filename)}"
+    assert header.isascii()
+
+
+def test_cache_budget_kept_without_explicit_value():
+    cache = get_document_cache(8, tenant="test-budget")
+    assert get_document_cache(tenant="test-budget") is cache
+    assert cache.budget_bytes == 8 * 1024 * 1024
+    get_document_cache(4, tenant="test-budget")
+    assert cache.budget_bytes == 4 * 1024 * 1024
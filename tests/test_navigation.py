@@ -0,0 +1,65 @@
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SLUG = "ternopil-teplo"
+HEADERS = {
+    "Документи": "📑 Офіційні документи",
+    "Фотогалерея": "📸 Фотогалерея",
+    "Контакти": "📞 Контактна інформація",
+}
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+    def start(page=None):
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+        at.session_state["tenant"] = SLUG
+        if page is not None:
+            at.session_state["current_page"] = page
+        at.run()
+        assert not at.exception
+        return at
+
+    return start
+
+
+def assert_rendered_in_one_run(at, page):
+    assert not at.exception
+    assert at.session_state["current_page"] == page
+    assert at.session_state["last_navigation_reruns"] == 1
+    assert any(HEADERS[page] in md.value for md in at.markdown)
+    assert at.sidebar.radio[0].value.endswith(page)
+
+
+@pytest.mark.parametrize("key, page", [
+    ("nav_docs", "Документи"),
+    ("nav_photos", "Фотогалерея"),
+    ("nav_contacts", "Контакти"),
+])
+def test_quick_navigation_single_run(app, key, page):
+    at = app()
+    next(button for button in at.button if button.key == key).click().run()
+    assert_rendered_in_one_run(at, page)
+
+
+@pytest.mark.parametrize("page", list(HEADERS))
+def test_sidebar_navigation_single_run(app, page):
+    at = app()
+    radio = at.sidebar.radio[0]
+    radio.set_value(next(option for option in radio.options if option.endswith(page))).run()
+    assert_rendered_in_one_run(at, page)
+
+
+def test_sidebar_leaves_admin_page(app, monkeypatch):
+    monkeypatch.setenv("ADMIN_PASSWORD", "secret")
+    at = app("Адміністрування")
+    assert at.sidebar.radio[0].value is None
+
+    at.sidebar.radio[0].set_value("🏠 Головна").run()
+    assert at.session_state["current_page"] == "Головна"
+    assert at.sidebar.radio[0].value == "🏠 Головна"
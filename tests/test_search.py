@@ -0,0 +1,84 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from heating import search
+from heating.config import Document
+from heating.search import SearchIndex, tokenize
+
+TEXTS = {
+    "license.pdf": ["Ліцензія на виробництво теплової енергії", "Серія АЕ № 527411, м. Тернопіль"],
+    "tariff.pdf": ["Рішення виконавчого комітету про тариф на теплову енергію", "Тернопільська міська рада"],
+    "scan.pdf": [""],
+}
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    for filename in TEXTS:
+        (folder / filename).write_bytes(f"%PDF {filename}".encode())
+    documents = (
+        Document("license", "Ліцензія", "Ліцензія на теплопостачання", "license.pdf", str(folder)),
+        Document("tariff", "Тариф", "Тариф на теплову енергію", "tariff.pdf", str(folder)),
+        Document("scan", "Об'єкти теплопостачання", "Перелік об’єктів", "scan.pdf", str(folder)),
+    )
+    calls = []
+
+    def extract_text(path, cache_dir):
+        calls.append(os.path.basename(path))
+        return TEXTS[os.path.basename(path)]
+
+    monkeypatch.setattr(search, "extract_text", extract_text)
+    tenant = SimpleNamespace(
+        slug="test-search",
+        config=SimpleNamespace(documents=documents),
+        cache_dir=lambda *parts: os.path.join(str(tmp_path / "cache"), *parts),
+    )
+    index = SearchIndex(tenant).refresh()
+    index.calls = calls
+    return index
+
+
+def keys(hits):
+    return [hit.key for hit in hits]
+
+
+def test_tokenize_ukrainian():
+    assert tokenize("Об'єкт ТЕПЛОПОСТАЧАННЯ, №527411 м.Тернопіль") == [
+        "обєкт", "теплопостачання", "527411", "м", "тернопіль",
+    ]
+    assert tokenize("пам’ять") == tokenize("пам'ять") == ["память"]
+    assert tokenize(" ,.- ") == []
+
+
+def test_prefix_matching(index):
+    assert keys(index.search("тернопіл")) == ["license", "tariff"]
+    assert keys(index.search("5274")) == ["license"]
+    assert index.search("тернопіль")[0].pages == (2,)
+
+
+def test_all_words_required(index):
+    assert keys(index.search("тариф тернопільська")) == ["tariff"]
+    assert keys(index.search("ліцензія тариф")) == []
+    assert index.search("") == []
+
+
+def test_titles_are_indexed(index):
+    # Скан без текстового шару знаходиться за назвою, з апострофом чи без
+    assert keys(index.search("об'єкти")) == ["scan"]
+    assert keys(index.search("обєкти")) == ["scan"]
+    # Слово з назви і слово з тексту в одному запиті
+    hits = index.search("теплопостачання серія")
+    assert keys(hits) == ["license"]
+    assert hits[0].pages == (2,)
+
+
+def test_unchanged_documents_are_not_reparsed(index):
+    index.calls.clear()
+    index.refresh()
+    assert index.calls == []
+    index.search("тариф")
+    assert index.calls == []
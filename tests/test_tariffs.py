@@ -0,0 +1,33 @@
+from heating.tariffs import TariffRow, parse_tariffs
+
+# Текст першої сторінки altenergoprostir/docs/тариф_АЕП.pdf, як його повертає pypdf:
+# рядки розірвані посередині речення, а "тариф" розбитий пробілом
+AEP_PAGE = """виконавчий комітет міської ради
+ВИРІШИВ:
+1. Встановити товариству з обмеженою відповідальністю «Альтенергопростір» та
+товариству з обмеженою відповідальністю «Тернопіль Тепло» тари ф на теплову
+енергію у розмірі 3879,09 грн. (три тисячі вісімсот сімдесят дев’ять гривень
+дев’ять копійок) за 1 Гкал без податку на додану вартість та тариф на
+виробництво теплової енергії з альтернативних джерел енергії в розмірі
+3194,26 грн. (три тисячі сто дев’яносто чотири гривні двадцять шість копійок) за
+1 Гкал без податку на додану вартість.
+2. Визнати таким, що втратив чинність"""
+
+
+def test_aep_decision():
+    assert parse_tariffs(["", AEP_PAGE]) == [
+        TariffRow("Тариф на теплову енергію", "3879,09", "грн/Гкал", "без ПДВ", 2),
+        TariffRow(
+            "Тариф на виробництво теплової енергії з альтернативних джерел енергії",
+            "3194,26", "грн/Гкал", "без ПДВ", 2,
+        ),
+    ]
+
+
+def test_inline_unit_with_vat():
+    rows = parse_tariffs(["Тариф на теплову енергію - 4 655,00 грн/Гкал з ПДВ."])
+    assert rows == [TariffRow("Тариф на теплову енергію", "4655,00", "грн/Гкал", "з ПДВ", 1)]
+
+
+def test_scan_without_text():
+    assert parse_tariffs(["", ""]) == []